@@ -1 +1 @@
-__all__ = ["control", "finder", "serial_interface"]
+__all__ = ["control", "searcher", "serial_interface"]
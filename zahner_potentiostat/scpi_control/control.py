@@ -25,7 +25,8 @@ THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
 from enum import Enum
-from typing import Optional, Union
+from typing import Optional, Union, Callable
+import functools
 import time
 import re
 import datetime
@@ -55,9 +56,58 @@ def firmwareStringToNumber(firmwareString):
     return firmwareNumber
 
 
+@functools.lru_cache(maxsize=256)
+def _encodeCommand(string: str) -> bytes:
+    """Encode a command with line feed for the interface.
+
+    Commands like parameters that are set again and again with the same value are encoded only
+    once. The result is bytes, so that the cached object cannot be changed.
+
+    :param string: String with command, without the line feed.
+    :returns: The encoded command with line feed.
+    """
+    return (string + "\n").encode("ASCII")
+
+
 requiredSoftwareVersionString = "1.1.0"
 requiredSoftwareVersion = firmwareStringToNumber(requiredSoftwareVersionString)
 
+"""
+Commands of the primitives and measurements, which never change.
+They are encoded once with line feed so they can be sent without conversion.
+"""
+_COMMAND_MEAS_VOLT = b":MEAS:VOLT?\n"
+_COMMAND_MEAS_CURR = b":MEAS:CURR?\n"
+_COMMAND_MEAS_TEMP = b":MEAS:TEMP?\n"
+_COMMAND_MEAS_RMPT = b":MEAS:RMPT?\n"
+_COMMAND_MEAS_RMPS = b":MEAS:RMPS?\n"
+_COMMAND_MEAS_RMPV = b":MEAS:RMPV?\n"
+_COMMAND_MEAS_POGA = b":MEAS:POGA?\n"
+_COMMAND_MEAS_OCVS = b":MEAS:OCVS?\n"
+_COMMAND_MEAS_OCV = b":MEAS:OCV?\n"
+_COMMAND_MEAS_IESC = b":MEAS:IESC?\n"
+
+"""
+Units of the time inputs with their factor to seconds.
+"""
+_TIME_UNIT_FACTORS = {"s": 1.0, "m": 60.0, "min": 60.0, "h": 3600.0}
+
+"""
+Regular expression for time inputs. Only the beginning of the unit is matched, so that inputs
+like "5 sec", "2 hours" or "5mins" are also accepted.
+"""
+_TIME_RE = re.compile(r"([0-9]+[.,]?[0-9]*)[ ]*(min|[mhs])")
+
+"""
+Beginnings of the commands which are executed in parallel to the other commands by the device.
+"""
+_CONTROL_COMMAND_PREFIXES = ("ABOR", ":ABOR", "*RST")
+
+"""
+Regular expression for the error number in an error answer of the device.
+"""
+_ERR_NUM_RE = re.compile(r"([0-9]+)")
+
 
 class COUPLING(Enum):
     """
@@ -78,6 +128,15 @@ class RELATION(Enum):
     OCV = 1
 
 
+class OUTPUT_PRIMITIVE(Enum):
+    """
+    Primitives with which a profile can be output.
+    """
+
+    POLARIZATION = "pol"
+    RAMP = "ramp"
+
+
 class SCPIDevice:
     """General important information for the control of the devices with this class.
 
@@ -119,6 +178,7 @@ class SCPIDevice:
     **Output potentiostatic or galvanostatic profile as potentiostatic and galvanostatic polarization or ramps**
 
     * :func:`~zahner_potentiostat.scpi_control.control.SCPIDevice.measureProfile`
+    * :func:`~zahner_potentiostat.scpi_control.control.SCPIDevice.measureProfileBulk`
 
     **PITT Potentiostatic Intermittent Titration Technique**
 
@@ -179,22 +239,35 @@ class SCPIDevice:
     :param dataInterface: SerialDataInterface object for online data.
     :type dataInterface: :class:`~zahner_potentiostat.scpi_control.serial_interface.SerialDataInterface`
     :param enablePackageUpdateWarning: False to disable warn output to the package version on the console.
+    :param pollInterval: Interval in seconds in which pollCallback is called while waiting for an answer.
+    :param pollCallback: Function without parameters, which is called periodically while waiting for
+        an answer from the device, for example during long primitives. This can be used to keep a GUI
+        responsive or to handle KeyboardInterrupt. None to wait blocking.
     """
 
     _commandInterface: SerialCommandInterface = None
     _coupling: COUPLING = COUPLING.POTENTIOSTATIC
     _raiseOnError: bool = False
+    _lastReplyError: bool = False
     _dataReceiver: Optional[DataReceiver] = None
+    _parameterCache: dict[str, tuple[str, str]] = dict()
+    _pollInterval: float = 0.1
+    _pollCallback: Optional[Callable[[], None]] = None
 
     def __init__(
         self,
         commandInterface: SerialCommandInterface,
         dataInterface: Optional[SerialDataInterface],
         enablePackageUpdateWarning: bool = True,
+        pollInterval: float = 0.1,
+        pollCallback: Optional[Callable[[], None]] = None,
     ):
         self._commandInterface = commandInterface
+        self._pollInterval = pollInterval
+        self._pollCallback = pollCallback
         self._coupling = COUPLING.POTENTIOSTATIC
         self._raiseOnError = False
+        self._parameterCache = dict()
         if dataInterface is not None:
             self._dataReceiver = DataReceiver(dataInterface)
         """
@@ -250,6 +323,7 @@ pip install zahner-potentiostat -U
 
         Close the connection and stop the receiver.
         """
+        self._parameterCache.clear()
         self._commandInterface.close()
         if self._dataReceiver != None:
             self._dataReceiver.stop()
@@ -337,6 +411,7 @@ pip install zahner-potentiostat -U
         :returns: The response string from the device.
         :rtype: string
         """
+        self._parameterCache.clear()
         return self._writeCommandToInterfaceAndReadLine("*CLS")
 
     def readState(self) -> str:
@@ -379,6 +454,7 @@ pip install zahner-potentiostat -U
         :returns: The response string from the device.
         :rtype: string
         """
+        self._parameterCache.clear()
         return self._writeCommandToInterfaceAndReadLine("*RST")
 
     def abortCommand(self) -> str:
@@ -398,6 +474,7 @@ pip install zahner-potentiostat -U
         :returns: The response string from the device.
         :rtype: string
         """
+        self._parameterCache.clear()
         return self._writeCommandToInterfaceAndReadLine("ABOR")
 
     def calibrateOffsets(self) -> str:
@@ -438,6 +515,7 @@ pip install zahner-potentiostat -U
 
         if self._dataReceiver != None:
             self._dataReceiver.stop()
+        self._parameterCache.clear()
         return self._writeCommandToInterfaceAndReadLine(":SYST:SEPC")
 
     def switchToEPCControlWithoutPotentiostatStateChange(self) -> str:
@@ -471,6 +549,7 @@ pip install zahner-potentiostat -U
 
         if self._dataReceiver != None:
             self._dataReceiver.stop()
+        self._parameterCache.clear()
         return self._writeCommandToInterfaceAndReadLine(":SYST:HOTS")
 
     def setLineFrequency(self, frequency: float) -> str:
@@ -582,9 +661,8 @@ pip install zahner-potentiostat -U
         :returns: The most recent measured voltage.
         :rtype: float
         """
-        line = self._writeCommandToInterfaceAndReadLine(":MEAS:VOLT?")
-        text = line.split(",")
-        return float(text[0])
+        line = self._writeBytesAndReadLine(_COMMAND_MEAS_VOLT)
+        return float(line.partition(",")[0])
 
     def getPotentialMedian(self, measurements: int = 7) -> float:
         """Read potential and calculate median.
@@ -624,7 +702,7 @@ pip install zahner-potentiostat -U
         :returns: The most recent measured current.
         :rtype: float
         """
-        return self._writeCommandToInterfaceAndReadValue(":MEAS:CURR?")
+        return self._writeBytesAndReadValue(_COMMAND_MEAS_CURR)
 
     def getCurrentMedian(self, measurements: int = 7) -> float:
         """Read current and calculate median.
@@ -960,13 +1038,17 @@ pip install zahner-potentiostat -U
         Parameters for primitives that require a minimum time.
         Enter the parameter as for :func:`~zahner_potentiostat.scpi_control.control.SCPIDevice.setTimeParameter`.
 
+        The command is only sent if the value differs from the last value sent.
+
         :SCPI-COMMAND: :PARA:TMIN <value>
         :param time: time parameter; for valid values see `setTimeParameter`
         :returns: The response string from the device.
         :rtype: string
         """
         value = self._processTimeInput(value)
-        return self._writeCommandToInterfaceAndReadLine(":PARA:TMIN " + str(value))
+        return self._writeParameterCommandToInterfaceAndReadLine(
+            ":PARA:TMIN " + str(value)
+        )
 
     def setVoltageParameterRelation(self, relation: Union[RELATION, str]) -> str:
         """Set the relation of the voltage parameter for primitves.
@@ -1119,12 +1201,14 @@ pip install zahner-potentiostat -U
         This can be used, for example, to apply a constant current until a voltage is reached.
         This is used in the method :func:`~zahner_potentiostat.scpi_control.control.SCPIDevice.measureCharge`.
 
+        The command is only sent if the state differs from the last state sent.
+
         :SCPI-COMMAND: :PARA:ULIM:STAT <ON|OFF>
         :param state: The state of check. True means turned on.
         :returns: The response string from the device.
         :rtype: string
         """
-        return self._writeCommandToInterfaceAndReadLine(
+        return self._writeParameterCommandToInterfaceAndReadLine(
             ":PARA:ULIM:STAT ON" if state else ":PARA:ULIM:STAT OFF"
         )
 
@@ -1455,7 +1539,7 @@ pip install zahner-potentiostat -U
         :returns: The measured temperature in degree celsius.
         :rtype: float
         """
-        return self._writeCommandToInterfaceAndReadValue(":MEAS:TEMP?")
+        return self._writeBytesAndReadValue(_COMMAND_MEAS_TEMP)
 
     def setStepSize(self, value: float) -> str:
         """Set the step size for primitives.
@@ -1522,11 +1606,11 @@ pip install zahner-potentiostat -U
         if duration != None:
             self.setTimeParameter(duration)
         if targetValue != None:
-            if self._coupling == COUPLING.GALVANOSTATIC:
+            if self._coupling is COUPLING.GALVANOSTATIC:
                 self.setCurrentParameter(targetValue)
             else:
                 self.setVoltageParameter(targetValue)
-        return self._writeCommandToInterfaceAndReadLine(":MEAS:RMPT?")
+        return self._writeBytesAndReadLine(_COMMAND_MEAS_RMPT)
 
     def measureRampValueInScanRate(
         self,
@@ -1582,11 +1666,11 @@ pip install zahner-potentiostat -U
         if scanrate != None:
             self.setScanRateParameter(scanrate)
         if targetValue != None:
-            if self._coupling == COUPLING.GALVANOSTATIC:
+            if self._coupling is COUPLING.GALVANOSTATIC:
                 self.setCurrentParameter(targetValue)
             else:
                 self.setVoltageParameter(targetValue)
-        return self._writeCommandToInterfaceAndReadLine(":MEAS:RMPS?")
+        return self._writeBytesAndReadLine(_COMMAND_MEAS_RMPS)
 
     def measureRampScanRateForTime(
         self,
@@ -1640,7 +1724,7 @@ pip install zahner-potentiostat -U
             self.setTimeParameter(time)
         if scanrate != None:
             self.setScanRateParameter(scanrate)
-        return self._writeCommandToInterfaceAndReadLine(":MEAS:RMPV?")
+        return self._writeBytesAndReadLine(_COMMAND_MEAS_RMPV)
 
     def measurePolarization(self) -> str:
         """POGA - Measurement of a potentiostatic or galvanostatic polarization.
@@ -1686,7 +1770,7 @@ pip install zahner-potentiostat -U
         :returns: The response string from the device.
         :rtype: string
         """
-        return self._writeCommandToInterfaceAndReadLine(":MEAS:POGA?")
+        return self._writeBytesAndReadLine(_COMMAND_MEAS_POGA)
 
     def measureOCVScan(self) -> str:
         """Measurement of open circuit voltage over time
@@ -1716,9 +1800,9 @@ pip install zahner-potentiostat -U
         :returns: The response string from the device.
         :rtype: string
         """
-        return self._writeCommandToInterfaceAndReadLine(":MEAS:OCVS?")
+        return self._writeBytesAndReadLine(_COMMAND_MEAS_OCVS)
 
-    def measureOCV(self) -> str:
+    def measureOCV(self) -> float:
         """Measurement of open circuit voltage.
 
         The potentiostat is automatically switched off by this method.
@@ -1730,7 +1814,7 @@ pip install zahner-potentiostat -U
         :returns: The open circuit voltage.
         :rtype: float
         """
-        return self._writeCommandToInterfaceAndReadValue(":MEAS:OCV?")
+        return self._writeBytesAndReadValue(_COMMAND_MEAS_OCV)
 
     def measureIEStairs(self) -> str:
         """Measurement of a voltage or current staircase.
@@ -1769,7 +1853,7 @@ pip install zahner-potentiostat -U
         :returns: The response string from the device.
         :rtype: string
         """
-        return self._writeCommandToInterfaceAndReadLine(":MEAS:IESC?")
+        return self._writeBytesAndReadLine(_COMMAND_MEAS_IESC)
 
     """
     Method which were composed from primitve as an example.
@@ -1857,7 +1941,7 @@ pip install zahner-potentiostat -U
         self.setCoupling("gal")
         if current > 0:
             raise ValueError("The current must be negative.")
-        self.setCurrentParameter(-1 * abs(current))
+        self.setCurrentParameter(-abs(current))
         self.setMinimumVoltageParameter(stopVoltage)
         self.setMaximumVoltageParameter(maximumVoltage)
         self.setMinimumTimeParameter(0)
@@ -1870,7 +1954,7 @@ pip install zahner-potentiostat -U
         profileDict: list[dict[str, float]],
         coupling: COUPLING,
         scalingFactor: float = 1,
-        outputPrimitive: str = "pol",
+        outputPrimitive: Union[OUTPUT_PRIMITIVE, str] = OUTPUT_PRIMITIVE.POLARIZATION,
     ) -> None:
         """Output a sequence of POGA or ramps.
 
@@ -1895,42 +1979,45 @@ pip install zahner-potentiostat -U
         :type coupling: :class:`~zahner_potentiostat.scpi_control.control.COUPLING`
         :param scalingFactor: Multiplier for the values from the dictionary, default 1, especially
                 for current normalization. But can also be used to multiply the voltage by a factor.
-        :param outputPrimitive: Default "pol" that means POGA, but "ramp" is also possible.
+        :param outputPrimitive: Default POLARIZATION that means POGA, but RAMP is also possible.
+            The strings "pol" and "ramp" are also supported.
+        :type outputPrimitive: :class:`~zahner_potentiostat.scpi_control.control.OUTPUT_PRIMITIVE`
         :rtype: None
         """
-        timestamp = profileDict[0]["time"]
-        value = profileDict[0]["value"]
-        lastTime = -100
+        self._outputProfile(
+            profileDict, coupling, scalingFactor, outputPrimitive, pipelined=False
+        )
+        return
 
-        self.setCoupling(coupling)
-        self.setMinimumTimeParameter(0)
-        if self._coupling == COUPLING.GALVANOSTATIC:
-            self.setCurrentParameter(value * scalingFactor)
-        else:
-            self.setVoltageParameter(value * scalingFactor)
-        self.setPotentiostatEnabled(True)
+    def measureProfileBulk(
+        self,
+        profileDict: list[dict[str, float]],
+        coupling: COUPLING,
+        scalingFactor: float = 1,
+        outputPrimitive: Union[OUTPUT_PRIMITIVE, str] = OUTPUT_PRIMITIVE.POLARIZATION,
+    ) -> None:
+        """Output a sequence of POGA or ramps with pipelined commands.
 
-        for point in profileDict[1:]:
-            nextTimestamp = point["time"]
-            if self._coupling == COUPLING.GALVANOSTATIC:
-                self.setCurrentParameter(value * scalingFactor)
-            else:
-                self.setVoltageParameter(value * scalingFactor)
+        This method outputs the same sequence as :func:`~zahner_potentiostat.scpi_control.control.SCPIDevice.measureProfile`
+        and takes the same parameters. The difference is that the commands of each step, the value,
+        the time if it has changed and the primitive, are written together. The device starts the
+        primitive without waiting for the round trips of the parameter commands, which shortens
+        the dead times between the primitives.
 
-            time = nextTimestamp - timestamp
-            if "pol" in outputPrimitive:
-                if time != lastTime:
-                    self.setMaximumTimeParameter(time)
-                self.measurePolarization()
-            else:
-                if time != lastTime:
-                    self.setTimeParameter(time)
-                self.measureRampValueInTime()
-            lastTime = time
-            value = point["value"]
-            timestamp = nextTimestamp
+        If a parameter command of a step is answered with an error, the primitive of this step has
+        already been sent. The error is raised after the primitive has finished.
 
-        self.setPotentiostatEnabled(False)
+        :param profileDict: Profile support points, see :func:`~zahner_potentiostat.scpi_control.control.SCPIDevice.measureProfile`.
+        :param coupling: Coupling of measurement.
+        :type coupling: :class:`~zahner_potentiostat.scpi_control.control.COUPLING`
+        :param scalingFactor: Multiplier for the values from the dictionary.
+        :param outputPrimitive: Default POLARIZATION that means POGA, but RAMP is also possible.
+        :type outputPrimitive: :class:`~zahner_potentiostat.scpi_control.control.OUTPUT_PRIMITIVE`
+        :rtype: None
+        """
+        self._outputProfile(
+            profileDict, coupling, scalingFactor, outputPrimitive, pipelined=True
+        )
         return
 
     def measurePITT(
@@ -1971,6 +2058,11 @@ pip install zahner-potentiostat -U
         self.checkConnectionPolarity()
         if stepVoltage <= 0:
             raise ValueError("Step size must be bigger than 0.")
+        """
+        The times are the same for every step, so they are converted to seconds only once.
+        """
+        onTime = self._processTimeInput(onTime)
+        openCircuitTime = self._processTimeInput(openCircuitTime)
         self.setMinimumTimeParameter(0)
         self.setChargeBreakEnabled(False)
         self.setToleranceBreakEnabled(False)
@@ -1980,19 +2072,26 @@ pip install zahner-potentiostat -U
 
         currentVoltage = self.measureOCV()
         """
+        The methods are bound once, as they are called for every step of both cycles.
+        """
+        setMaxTime = self.setMaximumTimeParameter
+        setVoltage = self.setVoltageParameter
+        measurePolarization = self.measurePolarization
+        measureOCVScan = self.measureOCVScan
+        """
         Up Cycle
         """
         if startWithOCVScan:
-            self.setMaximumTimeParameter(openCircuitTime)
-            self.measureOCVScan()
+            setMaxTime(openCircuitTime)
+            measureOCVScan()
 
         currentVoltage += stepVoltage
         while currentVoltage <= targetVoltage:
-            self.setMaximumTimeParameter(onTime)
-            self.setVoltageParameter(currentVoltage)
-            self.measurePolarization()
-            self.setMaximumTimeParameter(openCircuitTime)
-            self.measureOCVScan()
+            setMaxTime(onTime)
+            setVoltage(currentVoltage)
+            measurePolarization()
+            setMaxTime(openCircuitTime)
+            measureOCVScan()
             currentVoltage += stepVoltage
 
         """
@@ -2003,11 +2102,11 @@ pip install zahner-potentiostat -U
         else:
             currentVoltage -= 2 * stepVoltage
         while currentVoltage >= endVoltage:
-            self.setMaximumTimeParameter(onTime)
-            self.setVoltageParameter(currentVoltage)
-            self.measurePolarization()
-            self.setMaximumTimeParameter(openCircuitTime)
-            self.measureOCVScan()
+            setMaxTime(onTime)
+            setVoltage(currentVoltage)
+            measurePolarization()
+            setMaxTime(openCircuitTime)
+            measureOCVScan()
             currentVoltage -= stepVoltage
 
         self.setPotentiostatEnabled("off")
@@ -2045,6 +2144,11 @@ pip install zahner-potentiostat -U
         Charge break and Tolerance break are not supported.
         """
         self.checkConnectionPolarity()
+        """
+        The times are the same for every step, so they are converted to seconds only once.
+        """
+        onTime = self._processTimeInput(onTime)
+        openCircuitTime = self._processTimeInput(openCircuitTime)
         self.setMinimumTimeParameter(0)
         self.setChargeBreakEnabled(False)
         self.setToleranceBreakEnabled(False)
@@ -2063,7 +2167,19 @@ pip install zahner-potentiostat -U
         self.setMinMaxCurrentParameterCheckEnabled(False)
         self.setMinMaxVoltageParameterCheckEnabled(False)
 
-        answerFromDevice = ""
+        """
+        The maximum time is set directly before each primitive. The setter and the primitive are
+        sent together, so there is no round trip over the interface between them.
+        """
+        onTimeCommands = [
+            _encodeCommand(":PARA:TMAX " + str(onTime)),
+            _COMMAND_MEAS_POGA,
+        ]
+        openCircuitTimeCommands = [
+            _encodeCommand(":PARA:TMAX " + str(openCircuitTime)),
+            _COMMAND_MEAS_OCVS,
+        ]
+
         currentVoltage = self.measureOCV()
 
         self.setMaximumVoltageGlobal(targetVoltage)
@@ -2081,44 +2197,34 @@ pip install zahner-potentiostat -U
         Up Cycle - Charge
         """
         if startWithOCVScan:
-            self.setMaximumTimeParameter(openCircuitTime)
-            self.measureOCVScan()
-
-        while "error" not in answerFromDevice:
-            self.setMaximumTimeParameter(onTime)
-            answerFromDevice = self.measurePolarization()
-            if "error" in answerFromDevice:
-                """
-                Voltage Limit Reached
-
-                Set the limit slightly higher to avoid erroneous errors.
-                The voltage should become higher as the charge is applied.
-                """
-                self.clearState()
-                self.setMaximumVoltageGlobal(targetVoltage * 1.1)
-            self.setMaximumTimeParameter(openCircuitTime)
-            self.measureOCVScan()
+            self._writeBytesPipelinedAndReadLines(openCircuitTimeCommands)
+
+        """
+        When the voltage limit is reached, set the limit slightly higher to avoid erroneous errors.
+        The voltage should become higher as the charge is applied.
+        """
+        self._measureGITTHalfCycle(
+            onTimeCommands,
+            openCircuitTimeCommands,
+            self.setMaximumVoltageGlobal,
+            targetVoltage * 1.1,
+        )
 
         """
         Down Cycle - Discharge
         """
-        answerFromDevice = ""
-        self.setCurrentParameter(-1 * abs(current))
+        self.setCurrentParameter(-abs(current))
         self.setMinimumVoltageGlobal(endVoltage)
 
-        while "error" not in answerFromDevice:
-            self.setMaximumTimeParameter(onTime)
-            answerFromDevice = self.measurePolarization()
-            if "error" in answerFromDevice:
-                """
-                Voltage Limit Reached
-
-                Set the limit slightly lower to avoid erroneous errors.
-                """
-                self.clearState()
-                self.setMinimumVoltageGlobal(endVoltage * 0.9)
-            self.setMaximumTimeParameter(openCircuitTime)
-            self.measureOCVScan()
+        """
+        When the voltage limit is reached, set the limit slightly lower to avoid erroneous errors.
+        """
+        self._measureGITTHalfCycle(
+            onTimeCommands,
+            openCircuitTimeCommands,
+            self.setMinimumVoltageGlobal,
+            endVoltage * 0.9,
+        )
 
         self.setPotentiostatEnabled("off")
 
@@ -2132,6 +2238,117 @@ pip install zahner-potentiostat -U
     Private internal used functions.
     """
 
+    def _measureGITTHalfCycle(
+        self,
+        onTimeCommands: list[bytes],
+        openCircuitTimeCommands: list[bytes],
+        limitSetter: Callable[[float], str],
+        relaxedLimit: float,
+    ) -> None:
+        """Private function to measure the charge or discharge half cycle of the GITT.
+
+        Current pulses and open circuit phases are output alternately until the voltage limit is
+        reached, which the device reports as error. Then the error state is cleared, the limit is
+        set to relaxedLimit and the half cycle ends with a last open circuit phase.
+
+        :param onTimeCommands: Encoded commands for the current pulse.
+        :param openCircuitTimeCommands: Encoded commands for the open circuit phase.
+        :param limitSetter: Method of the global voltage limit that is reached in this half cycle.
+        :param relaxedLimit: The limit after the limit was reached.
+        :rtype: None
+        """
+        limitReached = False
+        while not limitReached:
+            self._writeBytesPipelinedAndReadLines(onTimeCommands)
+            limitReached = self._lastReplyError
+            if limitReached:
+                self.clearState()
+                limitSetter(relaxedLimit)
+            self._writeBytesPipelinedAndReadLines(openCircuitTimeCommands)
+        return
+
+    def _outputProfile(
+        self,
+        profileDict: list[dict[str, float]],
+        coupling: COUPLING,
+        scalingFactor: float,
+        outputPrimitive: Union[OUTPUT_PRIMITIVE, str],
+        pipelined: bool,
+    ) -> None:
+        """Private function which outputs a profile for measureProfile and measureProfileBulk.
+
+        The parameters are checked before the device is configured, so that invalid input does
+        not leave a partially configured device. Then the commands of all steps are generated.
+
+        :param profileDict: Profile support points, see measureProfile.
+        :param coupling: Coupling of measurement.
+        :param scalingFactor: Multiplier for the values from the dictionary.
+        :param outputPrimitive: POLARIZATION or RAMP, or the strings "pol" and "ramp".
+        :param pipelined: True to write the commands of each step together, False to send every
+            command on its own.
+        :rtype: None
+        """
+        if len(profileDict) < 2:
+            raise ValueError("The profile must contain at least two points.")
+        if not isinstance(coupling, (COUPLING, str)):
+            raise ValueError("invalid type for parameter `coupling`")
+
+        if isinstance(outputPrimitive, OUTPUT_PRIMITIVE):
+            outputPolarization = outputPrimitive is OUTPUT_PRIMITIVE.POLARIZATION
+        else:
+            outputPolarization = "pol" in outputPrimitive
+
+        self.setCoupling(coupling)
+        if self._coupling is COUPLING.GALVANOSTATIC:
+            valueHeader = ":PARA:IVAL "
+        else:
+            valueHeader = ":PARA:UVAL "
+        if outputPolarization:
+            timeHeader = ":PARA:TMAX "
+            primitiveCommand = _COMMAND_MEAS_POGA
+        else:
+            timeHeader = ":PARA:TIME "
+            primitiveCommand = _COMMAND_MEAS_RMPT
+
+        """
+        The commands of each step: the value, the time if it has changed and the primitive.
+        The values are not encoded with _encodeCommand, so that they do not displace the often
+        used commands from its cache.
+        """
+        steps = []
+        timestamp = profileDict[0]["time"]
+        value = profileDict[0]["value"]
+        lastTime = -100
+        for point in profileDict[1:]:
+            nextTimestamp = point["time"]
+            step = [(valueHeader + str(value * scalingFactor) + "\n").encode("ASCII")]
+            time = nextTimestamp - timestamp
+            if time != lastTime:
+                step.append((timeHeader + str(time) + "\n").encode("ASCII"))
+            step.append(primitiveCommand)
+            steps.append(step)
+            lastTime = time
+            value = point["value"]
+            timestamp = nextTimestamp
+
+        self.setMinimumTimeParameter(0)
+        """
+        The first step begins with the value of the first point, which is output before the
+        potentiostat is switched on.
+        """
+        self._writeBytesAndReadLine(steps[0][0])
+        self.setPotentiostatEnabled(True)
+
+        for step in steps:
+            if pipelined:
+                self._writeBytesPipelinedAndReadLines(step)
+            else:
+                for command in step:
+                    self._writeBytesAndReadLine(command)
+
+        self.setPotentiostatEnabled(False)
+        return
+
     def _processTimeInput(self, time: Union[float, str]) -> float:
         """Private function to process time inputs.
 
@@ -2154,23 +2371,44 @@ pip install zahner-potentiostat -U
             """
             Now interpreting the string as time to process seconds minutes and hours.
             """
-            timeRegex = re.compile("([0-9]+[.,]?[0-9]*)[ ]*((min)|([mhs]))")
-            timeMatch = timeRegex.match(time)
-            if timeMatch.group(1) != None and timeMatch.group(2) != None:
-                valueString = timeMatch.group(1)
-                valueString.replace(",", ".")
-                retval = float(valueString)
-
-                if timeMatch.group(2) in "min" or timeMatch.group(2) in "m":
-                    retval *= 60.0
-                elif timeMatch.group(2) in "h":
-                    retval *= 3600.0
-            else:
+            timeMatch = _TIME_RE.match(time.strip())
+            if timeMatch is None:
                 raise ValueError("Specified time incorrect")
+            retval = (
+                float(timeMatch[1].replace(",", ".")) * _TIME_UNIT_FACTORS[timeMatch[2]]
+            )
         else:
             retval = time
         return retval
 
+    def _writeParameterCommandToInterfaceAndReadLine(self, string: str) -> str:
+        """Private function to send a parameter command only if the value has changed.
+
+        The device keeps its parameters until they are changed, they are not reset by the
+        primitives. Therefore the last successfully sent command and its answer are cached with
+        the SCPI header as key. If the same command is sent again, the cached answer is returned
+        without communication with the device.
+
+        The cache assumes that the parameters of the device are only changed by this object.
+        It is cleared when the device is reset, aborted, its state is cleared, it is switched to
+        EPC control or the connection is closed. An answer with an error is not cached.
+
+        :param string: String with command, without the line feed.
+        :returns: Response string from the device.
+        :rtype: string
+        """
+        header = string.partition(" ")[0]
+        cached = self._parameterCache.pop(header, None)
+        if cached is not None and cached[0] == string:
+            self._parameterCache[header] = cached
+            self._lastReplyError = False
+            return cached[1]
+
+        line = self._writeCommandToInterfaceAndReadLine(string)
+        if not self._lastReplyError:
+            self._parameterCache[header] = (string, line)
+        return line
+
     def _writeCommandToInterfaceAndReadValue(self, string: str) -> float:
         """Private function to send a command to the device and read a float.
 
@@ -2199,24 +2437,88 @@ pip install zahner-potentiostat -U
         :rtype: string
         """
 
-        if "ABOR" in string or "*RST" in string:
-            line = self._commandInterface.sendStringAndWaitForReplyString(
-                string, CommandType.CONTROL
-            )
+        if string.startswith(_CONTROL_COMMAND_PREFIXES):
+            commandType = CommandType.CONTROL
         else:
-            line = self._commandInterface.sendStringAndWaitForReplyString(
-                string, CommandType.COMMAND
-            )
+            commandType = CommandType.COMMAND
+        return self._writeBytesAndReadLine(_encodeCommand(string), commandType)
+
+    def _writeBytesAndReadValue(self, command: bytes) -> float:
+        """Private function to send an encoded command to the device and read a float.
+
+        :param command: Encoded command, with the line feed.
+        :returns: Float value.
+        :rtype: float
+        """
+        line = self._writeBytesAndReadLine(command)
+        return float(line)
+
+    def _writeBytesAndReadLine(
+        self, command: bytes, commandType: CommandType = CommandType.COMMAND
+    ) -> str:
+        """Private function to send an encoded command to the device and read a string.
+
+        Commands which are sent often, like the primitives, are encoded once as module constants
+        and are sent with this function without conversion.
+
+        Whether the answer was an error is stored in _lastReplyError, so that callers do not have
+        to search the answer again.
+
+        :raises ZahnerSCPIError: Error number.
+        :param command: Encoded command, with the line feed.
+        :param commandType: Type of the command.
+        :returns: Response string from the device.
+        :rtype: string
+        """
+        line = self._commandInterface.sendBytesAndWaitForReplyString(
+            command, commandType, self._pollInterval, self._pollCallback
+        )
+
+        replyError = "error" in line
+        self._lastReplyError = replyError
+        if replyError:
+            line = self._processErrorReply(line)
+        return line
+
+    def _writeBytesPipelinedAndReadLines(self, commands: list[bytes]) -> list[str]:
+        """Private function to send several encoded commands at once and read all answers.
+
+        The commands are written together, so that the device does not wait for the round trip
+        over the interface between the commands. The answers are processed like the answers of
+        _writeBytesAndReadLine. _lastReplyError is True if one of the answers was an error.
 
-        if "error" in line:
-            if DEBUG == True:
-                line = self._commandInterface.getLastCommandWithAnswer()
-            if self._raiseOnError == True:
-                errorNumber = 42  # undefined error
-                numberRegex = re.compile(r".*?([0-9]+).*")
-                numberMatch = numberRegex.match(line)
-                if numberMatch.group(1) != None:
-                    errorNumber = int(numberMatch.group(1))
-                raise ZahnerSCPIError(errorNumber)
+        :raises ZahnerSCPIError: Error number of the first error.
+        :param commands: Encoded commands, each with the line feed.
+        :returns: Response strings from the device in the order of the commands.
+        :rtype: list[string]
+        """
+        lines = self._commandInterface.sendBytesAndWaitForReplyStrings(
+            commands, self._pollInterval, self._pollCallback
+        )
 
+        replyError = False
+        for index, line in enumerate(lines):
+            if "error" in line:
+                replyError = True
+                lines[index] = self._processErrorReply(line)
+        self._lastReplyError = replyError
+        return lines
+
+    def _processErrorReply(self, line: str) -> str:
+        """Private function to process an error answer of the device.
+
+        :raises ZahnerSCPIError: Error number, if raise on error is enabled.
+        :param line: The error answer from the device.
+        :returns: The answer, with the last command if DEBUG is enabled.
+        :rtype: string
+        """
+        raiseOnError = self._raiseOnError
+        if DEBUG == True:
+            line = self._commandInterface.getLastCommandWithAnswer()
+        if raiseOnError == True:
+            errorNumber = 42  # undefined error
+            numberMatch = _ERR_NUM_RE.search(line)
+            if numberMatch is not None:
+                errorNumber = int(numberMatch.group(1))
+            raise ZahnerSCPIError(errorNumber)
         return line
@@ -24,10 +24,35 @@ OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH
 THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
+import numpy
 from zahner_potentiostat.display.dcplot import DCPlot
 from .datareceiver import TrackTypes, DataReceiver
 from typing import Union, Optional
 
+"""
+Keys of the tracks in the data of the DataReceiver, which are needed by the DataManager.
+"""
+_TIME_KEY = TrackTypes.TIME.toString()
+_VOLTAGE_KEY = TrackTypes.VOLTAGE.toString()
+_CURRENT_KEY = TrackTypes.CURRENT.toString()
+
+"""
+Number of rows which are formatted together into one block when saving as text.
+"""
+_SAVE_BLOCK_ROWS = 4096
+
+"""
+Header and row format of the text file. The file contains only ASCII characters.
+"""
+_TEXT_HEADER = b"Time [s];\tVoltage [V];\tCurrent [A]\n"
+_TEXT_ROW_FORMAT = "%+.16E;\t%+.16E;\t%+.16E\n"
+_TEXT_FULL_BLOCK_FORMAT = _TEXT_ROW_FORMAT * _SAVE_BLOCK_ROWS
+
+"""
+Buffer size of the text file, so that several formatted blocks are written to the OS at once.
+"""
+_SAVE_BUFFER_SIZE = 1 << 20
+
 
 class DataManager:
     """
@@ -69,9 +94,9 @@ class DataManager:
         :param height: The height of the file to save in inch.
         """
         data = self._receiver.getCompletePoints()
-        x = data[TrackTypes.TIME.toString()]
-        y1 = data[TrackTypes.VOLTAGE.toString()]
-        y2 = data[TrackTypes.CURRENT.toString()]
+        x = data[_TIME_KEY]
+        y1 = data[_VOLTAGE_KEY]
+        y2 = data[_CURRENT_KEY]
 
         display = DCPlot(
             "Measured Data",
@@ -107,16 +132,49 @@ class DataManager:
         """
         data = self._receiver.getCompletePoints()
 
-        timeKey = TrackTypes.TIME.toString()
-        voltageKey = TrackTypes.VOLTAGE.toString()
-        currentKey = TrackTypes.CURRENT.toString()
+        """
+        The columns are converted into one array. Blocks of rows are formatted with one
+        format operation each and the blocks are written with a single writelines call.
+        """
+        rows = numpy.column_stack(
+            (data[_TIME_KEY], data[_VOLTAGE_KEY], data[_CURRENT_KEY])
+        ).astype(float)
+        numberOfRows = len(rows)
+
+        def formatBlocks():
+            yield _TEXT_HEADER
+            for start in range(0, numberOfRows, _SAVE_BLOCK_ROWS):
+                values = rows[start : start + _SAVE_BLOCK_ROWS].ravel().tolist()
+                if len(values) == 3 * _SAVE_BLOCK_ROWS:
+                    blockFormat = _TEXT_FULL_BLOCK_FORMAT
+                else:
+                    blockFormat = _TEXT_ROW_FORMAT * (len(values) // 3)
+                yield (blockFormat % tuple(values)).encode("ascii")
+
+        with open(filename, "wb", buffering=_SAVE_BUFFER_SIZE) as file:
+            file.writelines(formatBlocks())
+
+        return
+
+    def saveDataAsNpz(self, filename: str) -> None:
+        """Save data binary example.
+
+        This is an example to save the data after the measurement in the compressed numpy format.
+        The values are stored binary without conversion to text, which is considerably faster and
+        smaller than saveDataAsText for long measurements.
 
-        with open(filename, "wb") as file:
-            file.write("Time [s];\tVoltage [V];\tCurrent [A]\n".encode("utf-8"))
-            for i in range(len(data[timeKey])):
-                line = "{:+.16E};\t{:+.16E};\t{:+.16E}\n".format(
-                    data[timeKey][i], data[voltageKey][i], data[currentKey][i]
-                )
-                file.write(line.encode("utf-8"))
+        The file contains the arrays time, voltage and current, which can be read again with
+        numpy.load(filename).
 
+        :param filename: The path, filename and filetype of the file if it should be saved.
+            numpy appends .npz if the filename does not end with it.
+        """
+        data = self._receiver.getCompletePoints()
+
+        numpy.savez_compressed(
+            filename,
+            time=numpy.asarray(data[_TIME_KEY], dtype=float),
+            voltage=numpy.asarray(data[_VOLTAGE_KEY], dtype=float),
+            current=numpy.asarray(data[_CURRENT_KEY], dtype=float),
+        )
         return
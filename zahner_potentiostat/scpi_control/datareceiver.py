@@ -25,14 +25,23 @@ THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
 import struct
-from threading import Thread, Semaphore
+import array
+import numpy
+from threading import Thread, Lock
 from .error import ZahnerDataProtocolError
 from .serial_interface import SerialDataInterface
 from enum import Enum
-import copy
 import time
 from typing import Self, Union, Optional
 
+"""
+Compiled structs for the fields of the data protocol, so that the format is parsed only once.
+The device sends the values in little endian byte order.
+"""
+_U64 = struct.Struct("<Q")
+_F64 = struct.Struct("<d")
+_HEADER_QQ = struct.Struct("<QQ")
+
 
 class PacketTypes(Enum):
     """Enumeration with the numbers of the different package types."""
@@ -77,26 +86,24 @@ class TrackTypes(Enum):
         :param number: The number of the Track.
         :returns: The specific Track as TrackTypes Type.
         """
-        if number == TrackTypes.TIME.value:
-            return TrackTypes.TIME
-        elif number == TrackTypes.CURRENT.value:
-            return TrackTypes.CURRENT
-        elif number == TrackTypes.VOLTAGE.value:
-            return TrackTypes.VOLTAGE
-        else:
+        track = _TRACK_TYPES_BY_NUMBER.get(number)
+        if track is None:
             raise ValueError("Unknown Track")
+        return track
 
     @classmethod
     def stringToTrack(cls, string: str) -> Self:
         """Convert a string to the TrackType.
 
+        The string can be the name of the Track or the string returned by :func:`~TrackTypes.toString`.
+
         :param string: The Track as string of the Track.
         :returns: The specific Track as TrackTypes Type.
         """
-        for name, member in __class__.__members__.items():
-            if name in string:
-                return member
-        raise ValueError()
+        track = _TRACK_TYPES_BY_NAME.get(string.rpartition(".")[2])
+        if track is None:
+            raise ValueError("Unknown Track")
+        return track
 
     def __str__(self) -> str:
         """Overwrite the string representation of the object.
@@ -111,9 +118,16 @@ class TrackTypes(Enum):
     def toString(self) -> str:
         """Convert the TrackTypes Type to a String.
 
+        The strings are used as keys of the data tracks and are therefore generated only once.
+
         :returns: The TrackTypes Type as String.
         """
-        return self.__str__()
+        return _TRACK_TYPE_STRINGS[self]
+
+
+_TRACK_TYPE_STRINGS = {track: track.__str__() for track in TrackTypes}
+_TRACK_TYPES_BY_NUMBER = {track.value: track for track in TrackTypes}
+_TRACK_TYPES_BY_NAME = {track.name: track for track in TrackTypes}
 
 
 class DataReceiver:
@@ -150,6 +164,8 @@ class DataReceiver:
     _completeData: dict = dict()
     _onlineData: dict = dict()
     _currentTrackTypes: list = []
+    _rowStruct: Optional[struct.Struct] = None
+    _timeIndex: Optional[int] = None
     _lastHeaderSate: Union[HeaderState, None] = None
     _lastPacketType: Union[HeaderState, None] = None
     _maximumTimeInCycle: int = 0
@@ -157,11 +173,21 @@ class DataReceiver:
 
     def __init__(self, dataInterface: SerialDataInterface):
         self._dataInterface = dataInterface
+        self._packetProcessors = {
+            PacketTypes.DATALIGHT.value: self._processDataLight,
+            PacketTypes.DATALIGHTBULK.value: self._processDataLightBulk,
+            PacketTypes.DATALIGHTBULKAPPENDUM.value: self._processDataLightBulkAppendum,
+            PacketTypes.MEASUREMENTHEADER.value: self._processMeasurementHeader,
+            PacketTypes.MEASUREMENTTRACKS.value: self._processMeasurementTracks,
+        }
+        """
+        The locks must exist before the receive thread starts, because it uses them.
+        """
+        self._completeDataLock = Lock()
+        self._onlineDataLock = Lock()
         self._receiveThreadHandler = Thread(target=self._receiveDataThread)
         self._receiving_worker_is_running = True
         self._receiveThreadHandler.start()
-        self._completeDataSemaphore = Semaphore(1)
-        self._onlineDataSemaphore = Semaphore(1)
         return
 
     def stop(self) -> None:
@@ -192,12 +218,10 @@ class DataReceiver:
 
         :returns: Number of measurement points.
         """
-        if len(list(self._completeData.keys())) == 0:
+        if not self._completeData:
             return 0
         else:
-            return min(
-                [len(self._completeData[key]) for key in self._completeData.keys()]
-            )
+            return min(map(len, self._completeData.values()))
 
     def getNumberOfOnlinePoints(self) -> int:
         """Get the number of received live points.
@@ -207,10 +231,10 @@ class DataReceiver:
 
         :returns: Number of measurement points.
         """
-        if len(list(self._onlineData.keys())) == 0:
+        if not self._onlineData:
             return 0
         else:
-            return min([len(self._onlineData[key]) for key in self._onlineData.keys()])
+            return min(map(len, self._onlineData.values()))
 
     def getTrackTypeList(self) -> list[TrackTypes]:
         """List of track types that are currently being processed.
@@ -279,18 +303,8 @@ class DataReceiver:
         :returns: An array with the data for the track. Each returned data point consists of a
             dictionary with the track names.
         """
-        with self._completeDataSemaphore:
-            retval = copy.deepcopy(self._completeData)
-        if maxIndex == None:
-            maxIndex = min([len(retval[key]) for key in retval.keys()])
-
-        for track in retval.keys():
-            if maxIndex == 0:
-                retval[track] = []
-            elif maxIndex >= len(retval[track]):
-                pass
-            else:
-                retval[track] = retval[track][minIndex:maxIndex]
+        with self._completeDataLock:
+            retval = self._copyTracks(self._completeData, minIndex, maxIndex)
         return retval
 
     def getOnlinePoints(
@@ -305,18 +319,8 @@ class DataReceiver:
         :returns: An array with the data for the track. Each returned data point consists of a
             dictionary with the track names.
         """
-        with self._onlineDataSemaphore:
-            retval = copy.deepcopy(self._onlineData)
-        if maxIndex == None:
-            maxIndex = min([len(retval[key]) for key in retval.keys()])
-
-        for track in retval.keys():
-            if maxIndex == 0:
-                retval[track] = []
-            elif maxIndex >= len(retval[track]):
-                pass
-            else:
-                retval[track] = retval[track][minIndex:maxIndex]
+        with self._onlineDataLock:
+            retval = self._copyTracks(self._onlineData, minIndex, maxIndex)
         return retval
 
     def getCompleteAndOnlinePoints(self) -> dict[str, list[float]]:
@@ -325,22 +329,20 @@ class DataReceiver:
         :returns: An array with the data for the track. Each returned data point consists of a
             dictionary with the track names.
         """
-        complete = copy.deepcopy(self.getCompletePoints())
-        online = copy.deepcopy(self.getOnlinePoints())
+        complete = self.getCompletePoints()
+        online = self.getOnlinePoints()
         for key in complete.keys():
-            dataFromKey = online[key]
-            for data in dataFromKey:
-                complete[key].append(data)
+            complete[key].extend(online[key])
         return complete
 
     def deletePoints(self):
         """Delete the received complete points."""
-        with self._completeDataSemaphore:
+        with self._completeDataLock:
             self._completeData = dict()
             self._onlineData = dict()
             for key in self._currentTrackTypes:
-                self._completeData[key] = []
-                self._onlineData[key] = []
+                self._completeData[key] = array.array("d")
+                self._onlineData[key] = array.array("d")
             self._lastMaximumTime = 0
         return
 
@@ -349,25 +351,45 @@ class DataReceiver:
     These do not have to be used or accessed by the user.
     """
 
+    @staticmethod
+    def _copyTracks(
+        data: dict[str, list[float]], minIndex: int, maxIndex: Optional[int]
+    ) -> dict[str, list[float]]:
+        """Copy the index range of all tracks.
+
+        The tracks are stored internally as array.array of doubles, which need a quarter of the
+        memory of lists of floats. Only the requested range is converted to lists.
+
+        :param data: The tracks to copy.
+        :param minIndex: The first index.
+        :param maxIndex: The end index, None means the number of points of the shortest track.
+        :returns: Dictionary with copies of the tracks.
+        """
+        if maxIndex == None:
+            maxIndex = min(map(len, data.values()))
+
+        retval = dict()
+        for track, values in data.items():
+            if maxIndex == 0:
+                retval[track] = []
+            elif maxIndex >= len(values):
+                retval[track] = values.tolist()
+            else:
+                retval[track] = values[minIndex:maxIndex].tolist()
+        return retval
+
     def _receiveDataThread(self) -> None:
         """Receive thread which calls the individual decoders for the different packets."""
         packetError = False
+        packetProcessors = self._packetProcessors
         while self._receiving_worker_is_running == True:
             try:
-                packetType = self._readU64()
-                length = self._readU64()
+                packetType, length = self._readStruct(_HEADER_QQ)
 
                 # print(f"{time.time_ns()/1000000:>20.4f}\tpacketType: {packetType:X}\tlength: {length}")
-                if packetType == PacketTypes.DATALIGHT.value:
-                    self._processDataLight(length)
-                elif packetType == PacketTypes.DATALIGHTBULK.value:
-                    self._processDataLightBulk(length)
-                elif packetType == PacketTypes.DATALIGHTBULKAPPENDUM.value:
-                    self._processDataLightBulkAppendum(length)
-                elif packetType == PacketTypes.MEASUREMENTHEADER.value:
-                    self._processMeasurementHeader(length)
-                elif packetType == PacketTypes.MEASUREMENTTRACKS.value:
-                    self._processMeasurementTracks(length)
+                processor = packetProcessors.get(packetType)
+                if processor is not None:
+                    processor(length)
                 else:
                     packetError = True
                 self._lastPacketType = packetType
@@ -380,32 +402,36 @@ class DataReceiver:
 
     def _processDataLight(self, length: int) -> None:
         """Process packet type DataLight"""
-        numberOfTracks = length / 8
+        rowStruct = self._rowStruct
+        if rowStruct is None or length != rowStruct.size:
+            """
+            The packet is read completely before the error is raised, so that the following
+            packet is still read from its header.
+            """
+            self._dataInterface.readBytes(length)
+            raise ZahnerDataProtocolError("DataLight length does not match the tracks")
 
-        if numberOfTracks == len(self._currentTrackTypes):
-            dataPacket = dict()
-            for track in self._currentTrackTypes:
-                dataPacket[track] = self._readF64()
+        """
+        The values of all tracks are read with one read and unpacked with one call.
+        """
+        values = list(self._readStruct(rowStruct))
 
-            timeTrackName = TrackTypes.TIME.toString()
-            if timeTrackName in dataPacket.keys():
-                """
-                Correction of the time axis for successive primitives,
-                so that time continues to run and does not start at 0 for each primitive.
-                """
-                time = dataPacket[timeTrackName]
-                if time > self._maximumTimeInCycle:
-                    self._maximumTimeInCycle = time
-                dataPacket[timeTrackName] += self._lastMaximumTime
-            else:
-                raise ZahnerDataProtocolError("No Time track")
+        timeIndex = self._timeIndex
+        if timeIndex is None:
+            raise ZahnerDataProtocolError("No Time track")
 
-            for track in self._currentTrackTypes:
-                self._onlineData[track].append(dataPacket[track])
-        else:
-            raise ZahnerDataProtocolError(
-                "numberOfTracks != len(self._currentTrackTypes)"
-            )
+        """
+        Correction of the time axis for successive primitives,
+        so that time continues to run and does not start at 0 for each primitive.
+        """
+        time = values[timeIndex]
+        if time > self._maximumTimeInCycle:
+            self._maximumTimeInCycle = time
+        values[timeIndex] += self._lastMaximumTime
+
+        onlineData = self._onlineData
+        for track, value in zip(self._currentTrackTypes, values):
+            onlineData[track].append(value)
         return
 
     def _processDataLightBulk(self, length: int) -> None:
@@ -413,25 +439,84 @@ class DataReceiver:
         length -= 8  # startindex
         startIndex = self._readU64()
 
-        numberOfPackets = length / (len(self._currentTrackTypes) * 8)
-
-        if numberOfPackets.is_integer() == False:
-            raise ZahnerDataProtocolError("numberOfPackets for Bulk not correct")
-        else:
-            numberOfPackets = int(numberOfPackets)
-
         """
         Bulk data at the end of the measurement.
-        Delete all online data, then receive the complete data in the online data
-        Then transfer the online data to the complete data.
+        Delete all online data, then receive the bulk directly into the complete data, without
+        the copy over the online data. The transfer then only finishes the time axis of the cycle.
         """
 
         self._clearOnlineData()
+        self._processDataLightRows(length, toCompleteData=True)
+        self._onlineDataToCompleteData()
+        return
 
-        for i in range(numberOfPackets):
-            self._processDataLight(len(self._currentTrackTypes) * 8)
+    def _processDataLightRows(self, length: int, toCompleteData: bool = False) -> None:
+        """Process a block of DataLight rows without packet header.
 
-        self._onlineDataToCompleteData()
+        The block is read with one read and interpreted by numpy as array with one row per sample
+        and one column per track. The columns are then appended to the online data.
+
+        :param length: The length of the block in bytes.
+        :param toCompleteData: If True, the columns are appended to the complete data instead.
+        """
+        payload = self._dataInterface.readBytes(length)
+        rowStruct = self._rowStruct
+        if rowStruct is None or rowStruct.size == 0 or length % rowStruct.size != 0:
+            """
+            The block was read completely, so that the following packet is still read from its
+            header.
+            """
+            raise ZahnerDataProtocolError(
+                "DataLight block length does not match the tracks"
+            )
+        numberOfPackets = length // rowStruct.size
+        if numberOfPackets == 0:
+            return
+
+        timeIndex = self._timeIndex
+        if timeIndex is None:
+            raise ZahnerDataProtocolError("No Time track")
+
+        rows = numpy.frombuffer(payload, dtype="<f8").reshape(
+            numberOfPackets, len(self._currentTrackTypes)
+        )
+
+        """
+        Correction of the time axis for successive primitives,
+        so that time continues to run and does not start at 0 for each primitive.
+        """
+        timeColumn = rows[:, timeIndex]
+        maximumTime = float(timeColumn.max())
+        if maximumTime > self._maximumTimeInCycle:
+            self._maximumTimeInCycle = maximumTime
+
+        columns = []
+        for index in range(len(self._currentTrackTypes)):
+            if index == timeIndex:
+                columns.append(timeColumn + self._lastMaximumTime)
+            else:
+                columns.append(rows[:, index])
+
+        if toCompleteData:
+            with self._completeDataLock:
+                self._appendColumns(self._completeData, columns)
+        else:
+            self._appendColumns(self._onlineData, columns)
+        return
+
+    def _appendColumns(self, data: dict, columns: list[numpy.ndarray]) -> None:
+        """Append one numpy column per track to the tracks.
+
+        The strided column is copied once into a contiguous array of native doubles, whose buffer
+        is then appended without a further copy. No Python code runs per sample.
+
+        :param data: The tracks, online or complete data.
+        :param columns: The columns in the order of the current track types.
+        """
+        for track, column in zip(self._currentTrackTypes, columns):
+            data[track].frombytes(
+                numpy.ascontiguousarray(column, dtype=float).view(numpy.uint8)
+            )
         return
 
     def _sortOnlineDataByTrack(self, trackType: TrackTypes) -> None:
@@ -442,16 +527,13 @@ class DataReceiver:
         :param trackType:
         :type trackType: :class:`~zahner_potentiostat.scpi_control.datareceiver.TrackTypes`
         """
-        numberToSort = list(self._onlineData.keys()).index(trackType)
-        sorteddata = [
-            list(x)
-            for x in sorted(
-                zip(*self._onlineData.values()), key=lambda values: values[numberToSort]
-            )
-        ]
+        """
+        The stable sort keeps the received order of points with the same value, like sorted().
+        """
+        order = numpy.argsort(self._onlineData[trackType], kind="stable")
         self._onlineData = {
-            key: [row[list(self._onlineData.keys()).index(key)] for row in sorteddata]
-            for key in self._onlineData.keys()
+            key: array.array("d", numpy.asarray(values)[order].tobytes())
+            for key, values in self._onlineData.items()
         }
         return
 
@@ -464,18 +546,7 @@ class DataReceiver:
         trackType = self._readU64()
         trackType = TrackTypes.numberToTrack(trackType)
 
-        numberOfPackets = length / (len(self._currentTrackTypes) * 8)
-
-        if numberOfPackets.is_integer() == False:
-            raise ZahnerDataProtocolError(
-                "numberOfPackets for Bulk appendum not correct"
-            )
-        else:
-            numberOfPackets = int(numberOfPackets)
-
-        for i in range(numberOfPackets):
-            self._processDataLight(len(self._currentTrackTypes) * 8)
-
+        self._processDataLightRows(length)
         self._sortOnlineDataByTrack(trackType.toString())
 
         self._onlineDataToCompleteData()
@@ -483,8 +554,7 @@ class DataReceiver:
 
     def _processMeasurementHeader(self, length: int) -> None:
         """Process packet type MeasurementHeader"""
-        measurementType = self._readU64()
-        measurementState = self._readU64()
+        measurementType, measurementState = self._readStruct(_HEADER_QQ)
         measurementFlags = self._readString()
         measurementName = self._readString()
 
@@ -519,56 +589,65 @@ class DataReceiver:
         if len(self._currentTrackTypes) == 0:
             # empty or deleted
             self._currentTrackTypes = newTrackTypes
+            """
+            The layout of the rows is the same for all data packets until the tracks are changed,
+            so the struct of a row and the position of the time track are determined only once.
+            """
+            self._rowStruct = struct.Struct("<" + "d" * len(newTrackTypes))
+            timeTrackName = TrackTypes.TIME.toString()
+            if timeTrackName in newTrackTypes:
+                self._timeIndex = newTrackTypes.index(timeTrackName)
+            else:
+                self._timeIndex = None
             for track in newTrackTypes:
-                self._onlineData[track] = []
-                self._completeData[track] = []
+                self._onlineData[track] = array.array("d")
+                self._completeData[track] = array.array("d")
         else:
             if self._currentTrackTypes != newTrackTypes:
                 # data has to be cleared
                 raise ZahnerDataProtocolError("Primitive track types mismatch.")
         return
 
+    def _readStruct(self, structure: struct.Struct) -> tuple:
+        """Read several fixed size fields from the interface with one read.
+
+        :param structure: The compiled struct of the fields.
+        :returns: The read values.
+        """
+        return structure.unpack(self._dataInterface.readBytes(structure.size))
+
     def _readU64(self) -> int:
         """Read unsigned 64 bit integer from the interface.
 
         :returns: The read value.
         """
-        data = self._dataInterface.readBytes(8)
-        return struct.unpack("Q", data[0:8])[0]
+        return _U64.unpack(self._dataInterface.readBytes(8))[0]
 
     def _readF64(self) -> float:
         """Read 64 bit floating point from the interface.
 
         :returns: The read value.
         """
-        data = self._dataInterface.readBytes(8)
-        return struct.unpack("d", data[0:8])[0]
+        return _F64.unpack(self._dataInterface.readBytes(8))[0]
 
     def _readString(self) -> str:
         """Read a string from the interface.
 
-        :returns: The read string.
+        :returns: The read string, without the terminating zero.
         """
-        continueRead = True
-        data = bytearray()
-        while continueRead == True:
-            byte = self._dataInterface.readBytes(1)
-            if byte.decode("ASCII") == "\0":
-                continueRead = False
-            data.append(byte[0])
-
-        return data.decode("ASCII")
+        data = self._dataInterface.readUntil(b"\0")
+        return data[:-1].decode("ASCII")
 
     def _clearOnlineData(self) -> None:
         """Clear the received online data."""
-        with self._onlineDataSemaphore:
+        with self._onlineDataLock:
             for track in self._currentTrackTypes:
-                self._onlineData[track] = []
+                self._onlineData[track] = array.array("d")
         return
 
     def _onlineDataToCompleteData(self) -> None:
         """Transfer online to complete data."""
-        with self._completeDataSemaphore:
+        with self._completeDataLock:
             for track in self._currentTrackTypes:
                 self._completeData[track].extend(self._onlineData[track])
             self._clearOnlineData()
@@ -98,9 +98,8 @@ class ZahnerSCPIError(ZahnerError):
     def __init__(self, error_code: int):
         super().__init__(
             error_code,
-            (
-                self._message_strings[error_code]  # type: ignore # mypy gets confused here
-                if error_code in self._message_strings
-                else "unknown error maybe upgrade your version of `zahner_potentiostat` package"
+            self._message_strings.get(
+                error_code,
+                "unknown error maybe upgrade your version of `zahner_potentiostat` package",
             ),
         )
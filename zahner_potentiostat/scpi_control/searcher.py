@@ -24,11 +24,12 @@ OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH
 THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
-import glob
-import sys
+import copy
+import errno
 import time
-from typing import Union, Tuple
-from multiprocessing import Pool
+from threading import Lock
+from typing import Union, Tuple, Callable
+from concurrent.futures import ThreadPoolExecutor
 
 from serial import Serial
 import serial.tools.list_ports
@@ -44,6 +45,17 @@ class FoundDevices:
     serialNumber: Union[str, None] = None
     zahnerPort: dict[str, str] = dict()
     hpPort: Union[str, None] = None
+    messages: list[str] = []
+
+    def __init__(self):
+        """Constructor
+
+        The mutable fields are created for each instance, so that the results do not share them.
+        """
+        self.serialNumber = None
+        self.zahnerPort = dict()
+        self.hpPort = None
+        self.messages = []
 
 
 class SCPIDeviceSearcher:
@@ -62,6 +74,17 @@ class SCPIDeviceSearcher:
     ZAHNER_SCPI_DEVICENAME = "ZAHNER-ELEKTRIK"
     ZAHNER_VID = 0x0483
     ZAHNER_PID = 0xA3AD
+    SEARCH_CACHE_TIME = 5.0
+    MAXIMUM_PROBE_THREADS = 16
+    _IDN_BYTES = b"*IDN?\n"
+    _PORT_IN_USE_ERRNOS = (errno.EACCES, errno.EBUSY, errno.EAGAIN)
+
+    """
+    The results of the searches are shared by all searchers and reused for SEARCH_CACHE_TIME seconds,
+    because the connected devices rarely change between successive searches.
+    """
+    _searchCache: dict = dict()
+    _searchCacheLock = Lock()
 
     def __init__(self):
         """
@@ -69,16 +92,50 @@ class SCPIDeviceSearcher:
         """
         self.commandInterface = None
         self.dataInterface = None
+        self._openHandles = dict()
+        self._openHandlesLock = Lock()
+
+    def close(self) -> None:
+        """Close the serial interfaces which are still open from a search.
 
-    def searchDevices(self) -> list[str]:
+        The serial interfaces opened to check their availability are used again for the \*IDN? command.
+        After each search the remaining ones are closed, so this is only necessary if a search was interrupted.
+        """
+        with self._openHandlesLock:
+            handles = list(self._openHandles.values())
+            self._openHandles.clear()
+        for handle in handles:
+            handle.close()
+        return
+
+    def _openSerialInterface(self, port: str) -> Serial:
+        """Open a serial interface or take the handle that is still open from this search.
+
+        :param port: The name of the serial interface.
+        :returns: The open serial interface.
+        """
+        with self._openHandlesLock:
+            connection = self._openHandles.pop(port, None)
+        if connection is None:
+            connection = Serial(port=port, timeout=1, write_timeout=1)
+        return connection
+
+    def searchDevices(self, allSerialInterfaces: bool = False) -> list[str]:
         """Search connected devices with IDN command.
 
-        It is NOT recommended to use this command, because it opens all serial ports of the computer
+        By default only the serial interfaces with Zahner PID and VID are addressed, like with
+        :func:`~SCPIDeviceSearcher.searchZahnerDevices`.
+
+        It is NOT recommended to search all serial interfaces, because it opens all serial ports of the computer
         and speaks to the devices with the string \*IDN?, this could cause interference with the devices.
 
+        :param allSerialInterfaces: True to send \*IDN? to all serial interfaces of the computer.
         :returns: Returns a list with serial numbers of connected Zahner devices. The serial numbers are strings.
         """
-        devices = self.searchDevicesWithIDN(None)
+        if allSerialInterfaces:
+            devices = self.searchDevicesWithIDN(None)
+        else:
+            devices = self.searchZahnerDevices()
         return devices
 
     def searchZahnerDevices(self) -> list[str]:
@@ -89,8 +146,44 @@ class SCPIDeviceSearcher:
 
         :returns: Returns a list with serial numbers of connected Zahner devices. The serial numbers are strings.
         """
-        serialInterfacesWithZahnerVIDPID = self.searchSerialInterfacesWithZahnerVIDPID()
-        devices = self.searchDevicesWithIDN(serialInterfacesWithZahnerVIDPID)
+        pairs, unpairedPorts = self._searchZahnerInterfacePairs()
+        portsToCheck = [commandPort for commandPort, dataPort in pairs.values()]
+        portsToCheck.extend(unpairedPorts)
+        dataInterfaces = dict(pairs.values())
+        devices = self.searchDevicesWithIDN(portsToCheck)
+        for device in self.comportsWithZahnerDevices:
+            dataInterface = dataInterfaces.get(device["serial_name"])
+            if dataInterface is not None and device["binary"] == False:
+                device["data_serial_name"] = dataInterface
+        self._indexZahnerInterfaces()
+        return devices
+
+    def searchZahnerDevicesFast(self) -> list[str]:
+        """Search connected devices with Zahner PID and VID without IDN command.
+
+        The two serial interfaces of a device are assigned with the USB serial number and the USB interface
+        number, which are reported by the operating system. The devices are not addressed, therefore
+        the name and the software version of the devices are None.
+        Only serial interfaces which can not be assigned like this are asked with \*IDN?.
+        :func:`~SCPIDeviceSearcher.searchZahnerDevices` must be used, if the software version is required.
+
+        :returns: Returns a list with serial numbers of connected Zahner devices. The serial numbers are strings.
+        """
+        pairs, unpairedPorts = self._searchZahnerInterfacePairs()
+        devices = self.searchDevicesWithIDN(unpairedPorts)
+        for serialNumber, (commandPort, dataPort) in pairs.items():
+            if serialNumber not in devices:
+                devices.append(serialNumber)
+            data = dict()
+            data["serial_name"] = commandPort
+            data["manufacturer"] = SCPIDeviceSearcher.ZAHNER_SCPI_DEVICENAME
+            data["name"] = None
+            data["serialnumber"] = serialNumber
+            data["software_version"] = None
+            data["binary"] = False
+            data["data_serial_name"] = dataPort
+            self.comportsWithZahnerDevices.append(data)
+        self._indexZahnerInterfaces()
         return devices
 
     def searchSerialInterfacesWithZahnerVIDPID(self) -> list[str]:
@@ -100,7 +193,7 @@ class SCPIDeviceSearcher:
 
         :returns: List with serial interface names with Zahner PID and VID.
         """
-        ports = serial.tools.list_ports.comports()
+        ports = self._listSerialInterfaces()
         portsWithZahnerDevices = []
         for port in ports:
             if (
@@ -110,34 +203,145 @@ class SCPIDeviceSearcher:
                 portsWithZahnerDevices.append(port.device)
         return portsWithZahnerDevices
 
+    def _listSerialInterfaces(self) -> list:
+        """List the serial interfaces with their information from the operating system.
+
+        Listing the serial interfaces takes up to a few hundred milliseconds on Windows.
+        All searches therefore use the same list, which is cached like the search results.
+
+        :returns: List with the port information from serial.tools.list_ports.comports().
+        """
+        return self._cachedSearch("comports", serial.tools.list_ports.comports)
+
+    def _searchZahnerInterfacePairs(
+        self,
+    ) -> Tuple[dict[str, Tuple[str, str]], list[str]]:
+        """Search serial interfaces with Zahner PID and VID and pair them by device.
+
+        The two serial interfaces of a Zahner device have the same USB serial number.
+        The interface with the lower USB interface number is the command interface, the other one is
+        the data interface. The data interfaces of paired devices do not have to be asked with \*IDN?.
+        Interfaces which can not be paired are all asked with \*IDN?, as before.
+
+        :returns: Dictionary with the names of the command and the data interface for each USB serial
+            number and list with the names of the serial interfaces which could not be paired.
+        """
+        devices = dict()
+        for port in self._listSerialInterfaces():
+            if (
+                port.vid == SCPIDeviceSearcher.ZAHNER_VID
+                and port.pid == SCPIDeviceSearcher.ZAHNER_PID
+            ):
+                devices.setdefault(port.serial_number, []).append(port)
+
+        pairs = dict()
+        unpairedPorts = []
+        for serialNumber, ports in devices.items():
+            interfaceNumbers = [
+                SCPIDeviceSearcher._getUSBInterfaceNumber(port) for port in ports
+            ]
+            if (
+                serialNumber is not None
+                and len(ports) == 2
+                and None not in interfaceNumbers
+                and interfaceNumbers[0] != interfaceNumbers[1]
+            ):
+                if interfaceNumbers[0] > interfaceNumbers[1]:
+                    ports.reverse()
+                commandPort, dataPort = ports
+                pairs[serialNumber] = (commandPort.device, dataPort.device)
+            else:
+                unpairedPorts.extend(port.device for port in ports)
+        return pairs, unpairedPorts
+
+    @staticmethod
+    def _getUSBInterfaceNumber(port) -> Union[int, None]:
+        """Get the USB interface number of a serial interface.
+
+        pyserial reports the location as "<bus>-<ports>:<configuration>.<interface>".
+
+        :param port: The port information from serial.tools.list_ports.comports().
+        :returns: The interface number or None if it is not known.
+        """
+        location = port.location
+        if location is None or ":" not in location:
+            return None
+        try:
+            return int(location.rpartition(".")[2])
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _isBluetoothInterface(port) -> bool:
+        """Check if a serial interface is a virtual Bluetooth serial interface.
+
+        Windows reports them with the hardware ID BTHENUM, Linux as /dev/rfcomm* and macOS with
+        Bluetooth in the name.
+
+        :param port: The port information from serial.tools.list_ports.comports().
+        :returns: True if it is a Bluetooth serial interface.
+        """
+        return (
+            "BTHENUM" in port.hwid.upper()
+            or port.device.startswith("/dev/rfcomm")
+            or "bluetooth" in port.device.lower()
+        )
+
+    def clearSearchCache(self) -> None:
+        """Discard the cached search results.
+
+        The next search addresses the serial interfaces again, for example after a device was connected.
+        """
+        with SCPIDeviceSearcher._searchCacheLock:
+            SCPIDeviceSearcher._searchCache.clear()
+        return
+
+    def _cachedSearch(self, key: object, search: Callable[[], object]) -> object:
+        """Return the result of a search that is younger than SEARCH_CACHE_TIME, or search again.
+
+        The cache is shared by all searchers. Each caller gets a copy of the result, so that the
+        changes of one searcher, like the assigned data interfaces, do not reach the others.
+
+        :param key: Key of the search, for example with the list of searched ports.
+        :param search: Function which executes the search.
+        :returns: A copy of the result of the search.
+        """
+        with SCPIDeviceSearcher._searchCacheLock:
+            entry = SCPIDeviceSearcher._searchCache.get(key)
+        if entry is not None:
+            searchTime, result = entry
+            if time.monotonic() - searchTime < SCPIDeviceSearcher.SEARCH_CACHE_TIME:
+                return copy.deepcopy(result)
+        result = search()
+        with SCPIDeviceSearcher._searchCacheLock:
+            SCPIDeviceSearcher._searchCache[key] = (time.monotonic(), result)
+        return copy.deepcopy(result)
+
     def _checkPorts(self, port: str) -> FoundDevices:
         result = FoundDevices()
+        """
+        The messages are printed by the caller after all probes, so that the threads of the probes
+        do not wait for each other at the output.
+        """
         try:
-            connection = Serial(port=port, timeout=1, write_timeout=1)
-            writeTime = time.time()
-            connection.write(bytearray("*IDN?\n", "ASCII"))
-            while 1 > (time.time() - writeTime) and connection.inWaiting() == 0:
-                """
-                Wait 1 second or until data has arrived.
-                """
-                pass
-            if connection.inWaiting() == 0:
-                connection.close()
+            with self._openSerialInterface(port) as connection:
+                connection.write(SCPIDeviceSearcher._IDN_BYTES)
+                data = self._readAnswer(connection)
+            if len(data) == 0:
                 raise serial.SerialTimeoutException()
-            data = connection.read(1000)
-            data = data.decode("ASCII")
-            connection.close()
-            print(f"{port}: {data}")
-            string = data.split(",")
-            if len(data) > 3:
+            data = data.decode("ASCII", errors="replace")
+            result.messages.append(f"{port}: {data}")
+            """
+            The answer has four fields, the last one can also contain commas.
+            """
+            string = data.split(",", 3)
+            if len(string) == 4:
                 DeviceManufacturer = string[0].strip()
                 DeviceName = string[1].strip()
                 DeviceSerialNumber = string[2].strip()
                 DeviceSoftwareVersion = string[3].replace("binary", "").strip()
 
-                isBinary = False
-                if "binary" in data:
-                    isBinary = True
+                isBinary = "binary" in string[3]
 
                 if SCPIDeviceSearcher.ZAHNER_SCPI_DEVICENAME in DeviceManufacturer:
                     data = dict()
@@ -157,11 +361,63 @@ class SCPIDeviceSearcher:
                     """
                     result.hpPort = port
             else:
-                print(f"{port} error device answer: {data}")
-        except:
-            print("error: " + port)
+                result.messages.append(f"{port} error device answer: {data}")
+        except (serial.SerialException, OSError) as error:
+            if SCPIDeviceSearcher._isPortInUse(error):
+                """
+                The serial interface is used by another program.
+                """
+                result.messages.append("error: " + port + " in use")
+            else:
+                result.messages.append("error: " + port)
         return result
 
+    @staticmethod
+    def _isPortInUse(error: OSError) -> bool:
+        """Check if opening a serial interface failed because it is used or not accessible.
+
+        pyserial wraps the error of the operating system in a SerialException, which carries
+        the error number of the original error, or has the original error as context.
+
+        :param error: The exception raised when the serial interface was opened or used.
+        :returns: True if the serial interface is used by another program or access is denied.
+        """
+        if error.errno in SCPIDeviceSearcher._PORT_IN_USE_ERRNOS:
+            return True
+        context = error.__context__
+        return (
+            isinstance(context, OSError)
+            and context.errno in SCPIDeviceSearcher._PORT_IN_USE_ERRNOS
+        )
+
+    @staticmethod
+    def _readAnswer(connection: Serial, size: int = 1000) -> bytes:
+        """Read the answer line of a device.
+
+        Wait 1 second or until the first byte has arrived. The read blocks in the serial driver,
+        instead of polling the input buffer. Then all bytes already received are read with one call,
+        until the line feed has arrived. Serial.read_until() would read each byte with its own call.
+
+        :param connection: The open serial interface.
+        :param size: Maximum number of bytes to read.
+        :returns: The received bytes, empty if the device did not answer.
+        """
+        data = connection.read(1)
+        deadline = time.monotonic() + connection.timeout
+        while (
+            len(data) > 0
+            and b"\n" not in data
+            and len(data) < size
+            and time.monotonic() < deadline
+        ):
+            received = connection.read(
+                max(1, min(connection.in_waiting, size - len(data)))
+            )
+            if len(received) == 0:
+                break
+            data += received
+        return data
+
     def searchDevicesWithIDN(self, ports: str = None) -> list[str]:
         """Search connected devices with IDN command.
 
@@ -175,12 +431,31 @@ class SCPIDeviceSearcher:
         self.comportsWithZahnerDevices = []
         self.foundZahnerDevicesSerialNumbers = []
 
-        if ports == None:
-            ports = self._getAvailableSerialInterfaceNames()
-            print("Serial interfaces found: " + str(ports))
+        def search() -> list[FoundDevices]:
+            try:
+                searchPorts = ports
+                if searchPorts == None:
+                    searchPorts = self._getAvailableSerialInterfaceNames(keepOpen=True)
+                    print("Serial interfaces found: " + str(searchPorts))
 
-        with Pool(max(4, len(ports))) as p:
-            results = p.map(self._checkPorts, ports)
+                """
+                The probes only wait for the serial interfaces, so they run in threads instead of processes.
+                """
+                with ThreadPoolExecutor(
+                    max_workers=min(
+                        SCPIDeviceSearcher.MAXIMUM_PROBE_THREADS, len(searchPorts) or 1
+                    )
+                ) as executor:
+                    results = list(executor.map(self._checkPorts, searchPorts))
+                for result in results:
+                    for message in result.messages:
+                        print(message)
+                return results
+            finally:
+                self.close()
+
+        key = ("idn", None if ports == None else tuple(ports))
+        results = self._cachedSearch(key, search)
 
         for result in results:
             if result.serialNumber != None:
@@ -190,8 +465,30 @@ class SCPIDeviceSearcher:
             if result.hpPort != None:
                 self.comportsWithHPDevice.append(result.hpPort)
 
+        self._indexZahnerInterfaces()
         return self.foundZahnerDevicesSerialNumbers
 
+    def _indexZahnerInterfaces(self) -> None:
+        """Merge the found interfaces of each device into a dictionary with the serial number as key.
+
+        Each value is a dictionary with the names of the "command" and the "data" interface, which are
+        None if the interface was not found.
+        """
+        interfacesBySerialNumber = dict()
+        for device in self.comportsWithZahnerDevices:
+            interfaces = interfacesBySerialNumber.setdefault(
+                device["serialnumber"], {"command": None, "data": None}
+            )
+            if "data_serial_name" in device:
+                interfaces["command"] = device["serial_name"]
+                interfaces["data"] = device["data_serial_name"]
+            elif device["binary"] == True:
+                interfaces["data"] = device["serial_name"]
+            else:
+                interfaces["command"] = device["serial_name"]
+        self._interfacesBySerialNumber = interfacesBySerialNumber
+        return
+
     def selectDevice(
         self, serialNumber: Union[int, str, None] = None
     ) -> Tuple[SerialCommandInterface, SerialDataInterface]:
@@ -223,20 +520,19 @@ class SCPIDeviceSearcher:
             if len(self.foundZahnerDevicesSerialNumbers) > 0:
                 serialNumber = self.foundZahnerDevicesSerialNumbers[0]
             else:
+                self.clearSearchCache()
                 raise ZahnerConnectionError("no device found") from None
         """
         Search for the comports found in the previous one.
         """
-
-        for device in self.comportsWithZahnerDevices:
-            if serialNumber in device["serialnumber"] and device["binary"] == True:
-                self.dataInterface = device["serial_name"]
-            elif serialNumber in device["serialnumber"]:
-                self.commandInterface = device["serial_name"]
-
-        if self.commandInterface is None and self.dataInterface is None:
+        interfaces = self._interfacesBySerialNumber.get(serialNumber)
+        if interfaces is None:
+            self.clearSearchCache()
             raise ZahnerConnectionError("device not found") from None
 
+        self.commandInterface = interfaces["command"]
+        self.dataInterface = interfaces["data"]
+
         return self.commandInterface, self.dataInterface
 
     def getCommandInterface(self) -> SerialCommandInterface:
@@ -277,34 +573,42 @@ class SCPIDeviceSearcher:
         else:
             return None
 
-    def _getAvailableSerialInterfaceNames(self) -> list[str]:
+    def _getAvailableSerialInterfaceNames(self, keepOpen: bool = False) -> list[str]:
         """Detect the available serial interfaces.
 
         This function determines the available serial interfaces independently of the platform.
+        The serial interfaces are listed by the operating system, instead of trying all possible names.
+        Each of them is then opened once, to check if it can be used.
+        Bluetooth serial interfaces are skipped, because opening them can try to connect for several
+        seconds and the devices are not connected via Bluetooth.
 
+        :param keepOpen: True to keep the serial interfaces open for the following \*IDN? command.
+            They are closed with :func:`~SCPIDeviceSearcher.close`.
         :returns: A List with available comport names.
         """
-        if sys.platform.startswith("win"):
-            ports = ["COM%s" % (i + 1) for i in range(256)]
-        elif sys.platform.startswith("linux") or sys.platform.startswith("cygwin"):
-            # this excludes your current terminal "/dev/tty"
-            ports = glob.glob("/dev/tty[A-Za-z]+[A-Za-z0-9]*")
-        elif sys.platform.startswith("darwin"):
-            ports = glob.glob("/dev/tty.*")
-        else:
-            raise EnvironmentError("Unsupported platform")
+        ports = [
+            port.device
+            for port in self._listSerialInterfaces()
+            if not SCPIDeviceSearcher._isBluetoothInterface(port)
+        ]
 
         def testFunc(port: str) -> Union[str, None]:
             retval = None
             try:
                 s = Serial(port=port, timeout=1, write_timeout=1)
-                s.close()
+                if keepOpen:
+                    with self._openHandlesLock:
+                        self._openHandles[port] = s
+                else:
+                    s.close()
                 retval = port
-            except:
+            except (serial.SerialException, OSError):
                 pass
             return retval
 
-        with Pool(max(4, len(ports))) as p:
-            results = p.map(testFunc, ports)
+        with ThreadPoolExecutor(
+            max_workers=min(SCPIDeviceSearcher.MAXIMUM_PROBE_THREADS, len(ports) or 1)
+        ) as executor:
+            results = list(executor.map(testFunc, ports))
 
         return [i for i in results if i is not None]
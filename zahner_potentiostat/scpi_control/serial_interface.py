@@ -25,6 +25,8 @@ THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
 from abc import ABCMeta, abstractmethod
+from collections import deque
+from contextlib import nullcontext
 from datetime import datetime
 import threading
 from .error import ZahnerConnectionError
@@ -32,15 +34,29 @@ import serial
 from enum import Enum
 import queue
 from serial.serialutil import SerialException
-import time
-from typing import Optional, Union, ByteString
+from typing import Optional, Union, ByteString, Callable
 
 """
 With DEBUG = True it is switched on that log strings are stored.
 Then all commands that are sent and responses that are received are saved with timestamp.
+DEBUG must be set before the interfaces are opened.
 """
 DEBUG = False
 
+"""
+Maximum number of log entries, the oldest entries are discarded.
+"""
+LOG_LENGTH = 10000
+
+
+def _noLog(data: ByteString, direction: str) -> None:
+    """Replacement for SerialInterface.writeLog if DEBUG is False.
+
+    :param data: The data as bytearray().
+    :param direction: The direction as string.
+    """
+    return
+
 
 class CommandType(Enum):
     """
@@ -56,13 +72,19 @@ class SerialInterface(metaclass=ABCMeta):
     Abstract base class from which the data and command interfaces are derived.
     """
 
-    def __init__(self, serialName: str):
+    def __init__(self, serialName: str, lock: Optional[threading.Lock] = None):
         """Constructor
         :param serialName: Name of the serial interface.
+        :param lock: Lock to serialize the writes of several threads, None for no lock.
         """
         self.serialName = serialName
         self.serialConnection = None
-        self.logData = []
+        self._writeLock = lock if lock is not None else nullcontext()
+        self.logData = deque(maxlen=LOG_LENGTH)
+        """
+        The log function is selected once, so that nothing has to be checked per telegram.
+        """
+        self._log = self.writeLog if DEBUG else _noLog
         self.connect(self.serialName)
         self._startTelegramListener()
         return
@@ -96,6 +118,11 @@ class SerialInterface(metaclass=ABCMeta):
             raise ZahnerConnectionError(
                 "could not open port: " + self.serialName
             ) from None
+        """
+        The methods used per telegram are bound once per connection.
+        """
+        self._serialWrite = self.serialConnection.write
+        self._serialRead = self.serialConnection.read
         return
 
     def isConnected(self) -> bool:
@@ -111,12 +138,22 @@ class SerialInterface(metaclass=ABCMeta):
     def write(self, data: ByteString) -> None:
         """Write to the serial interface.
 
+        If a lock was passed to the constructor, the write is done while holding the lock.
+
+        :param data: The data as bytearray().
+        """
+        with self._writeLock:
+            self._writeUnlocked(data)
+        return
+
+    def _writeUnlocked(self, data: ByteString) -> None:
+        """Private method which writes to the serial interface without taking the lock.
+
         :param data: The data as bytearray().
         """
-        if DEBUG:
-            self.writeLog(data, "write")
+        self._log(data, "write")
         try:
-            self.serialConnection.write(data)
+            self._serialWrite(data)
         except SerialException:
             """
             Nothing can be sent to the device. The connection was probably interrupted and must be
@@ -138,17 +175,14 @@ class SerialInterface(metaclass=ABCMeta):
         """Write to the log.
 
         The time stamp is calculated automatically.
+        Each entry is a tuple of time, direction and data.
 
         :param data: The data as bytearray().
         :param direction: The direction as string.
         """
         if isinstance(data, bytearray) or isinstance(data, bytes):
             data = data.decode("ASCII")
-        log = dict()
-        log["time"] = datetime.now().time()
-        log["direction"] = direction
-        log["data"] = data.replace("\n", "")
-        self.logData.append(log)
+        self.logData.append((datetime.now().time(), direction, data.replace("\n", "")))
         return
 
     def getDebugString(
@@ -161,36 +195,52 @@ class SerialInterface(metaclass=ABCMeta):
         :param withTime: Output of the time points. True means with time.
         :param direction: The direction as string, which one you want to read. None means all.
         """
-        retval = ""
-        for log in self.logData:
-            if direction == None:
-                if withTime == True:
-                    retval += str(log["time"]) + " "
-                retval += log["direction"] + ":\t"
-                retval += log["data"] + "\n"
-            else:
-                if log["direction"] == direction:
-                    if withTime == True:
-                        retval += str(log["time"]) + " "
-                    retval += log["data"] + "\n"
-        return retval
+        return self._formatLog(self.logData, withTime, direction)
 
     def getLastCommandWithAnswer(
         self, withTime: bool = False, direction: Optional[str] = None
     ) -> str:
-        retval = ""
-        for log in self.logData[-2:]:
-            if direction == None:
-                if withTime == True:
-                    retval += str(log["time"]) + " "
-                retval += log["direction"] + ":\t"
-                retval += log["data"] + "\n"
+        lastLogs = [
+            self.logData[index] for index in range(-min(2, len(self.logData)), 0)
+        ]
+        return self._formatLog(lastLogs, withTime, direction)
+
+    @staticmethod
+    def _formatLog(logs, withTime: bool, direction: Optional[str]) -> str:
+        """Private method which formats log entries as string.
+
+        The lines are collected in a list and joined once, instead of extending the string for each entry.
+
+        :param logs: The log entries as tuples of time, direction and data.
+        :param withTime: Output of the time points. True means with time.
+        :param direction: The direction as string, which one you want to read. None means all.
+        :returns: One line per log entry.
+        """
+        if direction == None:
+            if withTime == True:
+                lines = [
+                    f"{logTime} {logDirection}:\t{logData}\n"
+                    for logTime, logDirection, logData in logs
+                ]
+            else:
+                lines = [
+                    f"{logDirection}:\t{logData}\n"
+                    for logTime, logDirection, logData in logs
+                ]
+        else:
+            if withTime == True:
+                lines = [
+                    f"{logTime} {logData}\n"
+                    for logTime, logDirection, logData in logs
+                    if logDirection == direction
+                ]
             else:
-                if log["direction"] == direction:
-                    if withTime == True:
-                        retval += str(log["time"]) + " "
-                    retval += log["data"] + "\n"
-        return retval
+                lines = [
+                    f"{logData}\n"
+                    for logTime, logDirection, logData in logs
+                    if logDirection == direction
+                ]
+        return "".join(lines)
 
     def _startTelegramListener(self) -> None:
         """Private method which starts the receive thread."""
@@ -201,18 +251,23 @@ class SerialInterface(metaclass=ABCMeta):
 
     def _stopTelegramListener(self) -> None:
         """Private method which stopps the receive thread."""
+        self._receiving_worker_is_running = False
         try:
             """
             It could be that the connection has already been closed and the receiving thread has
-            been terminated. Then an exception is thrown here when trying to close again or to
-            interrupt the operations.
+            been terminated, then there is nothing to interrupt.
+
+            The blocking read of the receive thread is interrupted with cancel_read, then the
+            thread sees the cleared flag. Waiting for the thread beforehand is not necessary.
+            """
+            if self.isConnected():
+                self.serialConnection.cancel_read()
+                self.serialConnection.cancel_write()
+                self.serialConnection.close()
+        except (SerialException, OSError):
+            """
+            The device was disconnected, the receive thread is terminated by the failed read.
             """
-            self._receiving_worker_is_running = False
-            time.sleep(0.1)
-            self.serialConnection.cancel_read()
-            self.serialConnection.cancel_write()
-            self.serialConnection.close()
-        except:
             pass
         finally:
             self.receivingWorker.join()
@@ -233,33 +288,98 @@ class SerialCommandInterface(SerialInterface):
     """
     Class which implements the command interface.
 
+    If the interface is used by several threads, a lock can be passed with which the writes and
+    the registration of the expected replies are serialized.
+
     :param serialName: Name of the serial interface.
+    :param lock: Lock to serialize the writes of several threads, None for no lock.
     """
 
-    def __init__(self, serialName: str):
-        """Constructor"""
-        self.waiting = dict()
-        self.waiting[CommandType.COMMAND.value] = None
-        self.waiting[CommandType.CONTROL.value] = None
+    """
+    Receiver of a line, indexed with the waiting bits of the receive thread and bit 2 set if the
+    line contains ok. True for the control command, False for the command and None if nothing
+    is waiting.
+    """
+    _REPLY_IS_CONTROL = (None, False, True, False, None, False, True, True)
 
-        self.queues = dict()
-        self.queues[CommandType.COMMAND.value] = queue.SimpleQueue()
-        self.queues[CommandType.CONTROL.value] = queue.SimpleQueue()
+    """
+    Maximum time in seconds a control command waits for the replies to queued pipelined commands.
+    """
+    PIPELINED_REPLIES_TIMEOUT = 1.0
 
-        super().__init__(serialName)
+    def __init__(self, serialName: str, lock: Optional[threading.Lock] = None):
+        """Constructor"""
+        """
+        Reply queues of the outstanding replies for each command type, in the order of the sent
+        commands. The sending threads append the reply queue of the calling thread and only the
+        receive thread takes them out, so every reply is delivered to the thread which sent the
+        command, even if several threads send commands.
+        """
+        self._pendingCommands = deque()
+        self._pendingControls = deque()
+        """
+        Every thread has its own reply queue for each command type.
+        """
+        self._replyQueues = threading.local()
+        """
+        Notified by the receive thread when at most one reply to a command is outstanding.
+        """
+        self._commandRepliesCondition = threading.Condition()
+        """
+        Bytes received by the receive thread which do not yet form a complete line.
+        """
+        self._receiveBuffer = bytearray()
+
+        super().__init__(serialName, lock)
         return
 
     def waitForReplyString(
-        self, commandType: CommandType, timeout: Optional[float] = None
+        self,
+        commandType: CommandType,
+        timeout: Optional[float] = None,
+        pollInterval: float = 0.1,
+        pollCallback: Optional[Callable[[], None]] = None,
     ) -> str:
-        """Waiting for the reply string.
+        """Waiting for the reply string to a command which was sent by the calling thread.
+
+        If a pollCallback is passed, the queue is polled every pollInterval seconds and the
+        callback is called between the polls until the reply has arrived. The timeout is not
+        used then. This keeps the calling thread responsive during long primitives, for example
+        for KeyboardInterrupt or for the event loop of a GUI.
+
+        If the callback raises an exception, for example KeyboardInterrupt, or the timeout expires,
+        the reply is abandoned. It is discarded when it arrives, so that the following replies are
+        still assigned to their commands. The measurement can then be aborted with ABOR.
 
         :param commandType: Type of the command.
         :param timeout: The timeout for reading, None for blocking.
+        :param pollInterval: The interval in seconds in which the pollCallback is called.
+        :param pollCallback: Function without parameters which is called while waiting or None.
         :type commandType: :class:`~zahner_potentiostat.scpi_control.serial_interface.CommandType`
         :returns: The answer string.
         """
-        reply = self.queues[commandType.value].get(True, timeout=timeout)
+        replyQueue = self._queueFor(commandType)
+        """
+        The replies abandoned before by this thread arrive in its queue before the awaited reply.
+        """
+        abandoned = self._takeAbandonedReplies(commandType)
+        try:
+            while True:
+                if pollCallback is None:
+                    reply = replyQueue.get(True, timeout=timeout)
+                else:
+                    while True:
+                        try:
+                            reply = replyQueue.get(True, timeout=pollInterval)
+                            break
+                        except queue.Empty:
+                            pollCallback()
+                if abandoned == 0 or reply == None:
+                    break
+                abandoned -= 1
+        except BaseException:
+            self._addAbandonedReplies(commandType, abandoned + 1)
+            raise
         if reply == None:
             raise ZahnerConnectionError("Connection to the device interrupted")
         return reply
@@ -273,12 +393,201 @@ class SerialCommandInterface(SerialInterface):
         :type commandType: :class:`~zahner_potentiostat.scpi_control.serial_interface.CommandType`
         :returns: The answer string.
         """
-        command = bytearray(string + "\n", "ASCII")
-        self.waiting[commandType.value] = command
-        self.write(command)
-        reply = self.waitForReplyString(commandType)
+        command = string.encode("ASCII") + b"\n"
+        return self.sendBytesAndWaitForReplyString(command, commandType)
+
+    def sendBytesAndWaitForReplyString(
+        self,
+        command: ByteString,
+        commandType: CommandType = CommandType.COMMAND,
+        pollInterval: float = 0.1,
+        pollCallback: Optional[Callable[[], None]] = None,
+    ) -> str:
+        """Sending an already encoded command and waiting for the response.
+
+        The command must already contain the line feed at the end.
+        The poll parameters are described in :func:`~zahner_potentiostat.scpi_control.serial_interface.SerialCommandInterface.waitForReplyString`.
+
+        :param command: The command as bytes with line feed.
+        :type commandType: :class:`~zahner_potentiostat.scpi_control.serial_interface.CommandType`
+        :param pollInterval: The interval in seconds in which the pollCallback is called.
+        :param pollCallback: Function without parameters which is called while waiting or None.
+        :returns: The answer string.
+        """
+        with self._writeLock:
+            if commandType is CommandType.CONTROL:
+                self._waitForPipelinedCommandReplies()
+                self._pendingControls.append(self._queueFor(commandType))
+            else:
+                self._pendingCommands.append(self._queueFor(commandType))
+            self._writeUnlocked(command)
+        reply = self.waitForReplyString(
+            commandType, pollInterval=pollInterval, pollCallback=pollCallback
+        )
         return reply
 
+    def sendStringsAndWaitForReplyStrings(self, strings: list[str]) -> list[str]:
+        """Sending several strings at once and waiting for all responses.
+
+        See :func:`~zahner_potentiostat.scpi_control.serial_interface.SerialCommandInterface.sendBytesAndWaitForReplyStrings`.
+
+        :param strings: The strings to send.
+        :returns: The answer strings in the order of the strings.
+        """
+        if not strings:
+            return []
+        data = ("\n".join(strings) + "\n").encode("ASCII")
+        return self._sendPipelinedAndWaitForReplyStrings(data, len(strings))
+
+    def sendBytesAndWaitForReplyStrings(
+        self,
+        commands: list[ByteString],
+        pollInterval: float = 0.1,
+        pollCallback: Optional[Callable[[], None]] = None,
+    ) -> list[str]:
+        """Sending several encoded commands at once and waiting for all responses.
+
+        The commands are written with one write, so that the device can process the next command
+        directly after the previous one without waiting for the round trip over the interface.
+        The device answers every command with one line in the order of the commands.
+
+        Only commands of the type CommandType.COMMAND can be sent with this method.
+        Every command must already contain the line feed at the end.
+
+        :param commands: The commands as bytes with line feed.
+        :param pollInterval: The interval in seconds in which the pollCallback is called.
+        :param pollCallback: Function without parameters which is called while waiting or None.
+        :returns: The answer strings in the order of the commands.
+        """
+        if not commands:
+            return []
+        return self._sendPipelinedAndWaitForReplyStrings(
+            b"".join(commands), len(commands), pollInterval, pollCallback
+        )
+
+    def _sendPipelinedAndWaitForReplyStrings(
+        self,
+        data: ByteString,
+        numberOfCommands: int,
+        pollInterval: float = 0.1,
+        pollCallback: Optional[Callable[[], None]] = None,
+    ) -> list[str]:
+        """Private method which writes several joined commands with one write and waits for all responses.
+
+        :param data: The commands joined to one bytes object, each with line feed.
+        :param numberOfCommands: The number of commands in data.
+        :param pollInterval: The interval in seconds in which the pollCallback is called.
+        :param pollCallback: Function without parameters which is called while waiting or None.
+        :returns: The answer strings in the order of the commands.
+        """
+        with self._writeLock:
+            self._pendingCommands.extend(
+                [self._queueFor(CommandType.COMMAND)] * numberOfCommands
+            )
+            self._writeUnlocked(data)
+        replies = []
+        try:
+            for _ in range(numberOfCommands):
+                replies.append(
+                    self.waitForReplyString(
+                        CommandType.COMMAND,
+                        pollInterval=pollInterval,
+                        pollCallback=pollCallback,
+                    )
+                )
+        except BaseException:
+            """
+            The reply which was awaited is already abandoned, the replies after it are abandoned too.
+            """
+            self._addAbandonedReplies(
+                CommandType.COMMAND, numberOfCommands - len(replies) - 1
+            )
+            raise
+        return replies
+
+    def _queueFor(self, commandType: CommandType) -> queue.SimpleQueue:
+        """Private method which returns the queue of the calling thread for the replies of the command type.
+
+        :param commandType: Type of the command.
+        :returns: The queue of the replies.
+        """
+        name = "control" if commandType is CommandType.CONTROL else "command"
+        replyQueue = getattr(self._replyQueues, name, None)
+        if replyQueue is None:
+            replyQueue = queue.SimpleQueue()
+            setattr(self._replyQueues, name, replyQueue)
+        return replyQueue
+
+    def _takeAbandonedReplies(self, commandType: CommandType) -> int:
+        """Private method which returns and resets the number of abandoned replies of the calling thread.
+
+        :param commandType: Type of the command.
+        :returns: The number of replies which must be discarded when they arrive.
+        """
+        name = (
+            "controlAbandoned"
+            if commandType is CommandType.CONTROL
+            else "commandAbandoned"
+        )
+        abandoned = getattr(self._replyQueues, name, 0)
+        setattr(self._replyQueues, name, 0)
+        return abandoned
+
+    def _addAbandonedReplies(self, commandType: CommandType, number: int) -> None:
+        """Private method which adds replies of the calling thread which are no longer awaited.
+
+        :param commandType: Type of the command.
+        :param number: The number of replies which are discarded when they arrive.
+        """
+        name = (
+            "controlAbandoned"
+            if commandType is CommandType.CONTROL
+            else "commandAbandoned"
+        )
+        setattr(self._replyQueues, name, getattr(self._replyQueues, name, 0) + number)
+        return
+
+    def _waitForPipelinedCommandReplies(self) -> None:
+        """Private method which waits until at most one reply to a command is outstanding.
+
+        While a control command is waiting, an ok is assigned to the control command. If the
+        replies to several pipelined commands are outstanding, the ok of a queued command such as
+        :PARA:TMAX could be taken as the reply to ABOR. Therefore a control command is only sent
+        when at most the last command of a batch, the running primitive, is outstanding.
+
+        If the device does not answer the queued commands within PIPELINED_REPLIES_TIMEOUT, the
+        control command is sent anyway, because ABOR and *RST must be able to free a device which
+        stalls. The assignment of the replies can then be wrong.
+        """
+        with self._commandRepliesCondition:
+            self._commandRepliesCondition.wait_for(
+                lambda: len(self._pendingCommands) <= 1
+                or not self._receiving_worker_is_running,
+                timeout=SerialCommandInterface.PIPELINED_REPLIES_TIMEOUT,
+            )
+        return
+
+    def _readLine(self) -> bytes:
+        """Private method which reads the next line from the serial interface.
+
+        readline of pyserial reads the line byte by byte. Instead the bytes received meanwhile
+        are read with one call into a buffer from which the complete lines are taken.
+
+        :returns: The line with the line break, or an empty bytes object if the read was interrupted.
+        """
+        buffer = self._receiveBuffer
+        lineEnd = buffer.find(b"\n")
+        while lineEnd < 0:
+            searchStart = len(buffer)
+            receivedBytes = self._serialRead(self.serialConnection.in_waiting or 1)
+            if not receivedBytes:
+                return b""
+            buffer += receivedBytes
+            lineEnd = buffer.find(b"\n", searchStart)
+        line = bytes(buffer[: lineEnd + 1])
+        del buffer[: lineEnd + 1]
+        return line
+
     def _telegramListenerJob(self) -> None:
         """Method in which the receive thread runs.
 
@@ -286,18 +595,18 @@ class SerialCommandInterface(SerialInterface):
         """
         while self._receiving_worker_is_running:
             try:
-                line = self.serialConnection.readline()
+                line = self._readLine()
                 """
                 If the connection is terminated and the blocking read is interrupted,
                 then an empty string is returned.
                 """
 
-                if DEBUG:
-                    self.writeLog(line, "read")
+                self._log(line, "read")
 
-                line = line.decode("ASCII")
-
-                if line == "":
+                """
+                The line is checked as bytes and only decoded for the queue of the reply.
+                """
+                if line == b"":
                     self._receiving_worker_is_running = False
                 else:
                     """
@@ -311,56 +620,48 @@ class SerialCommandInterface(SerialInterface):
                     ABOR and *RST are always answered with ok.
                     The command which was aborted returns a corresponding status.
                     But if the command was terminated before the ABOR was processed then also two ok can be returned.
+
+                    Each line is assigned on its own, so no second line has to be awaited.
+                    The replies of each type arrive in the order of the commands, so each reply is
+                    put into the first pending reply queue of its type.
+
+                    Bit 0 of waiting is set if a command is waiting, bit 1 if a control command is waiting.
+                    If both are waiting, ABORT and RESET always get the ok.
+                    If both answers are ok, it does not matter which one gets which.
+                    A control command is only sent while at most one command is outstanding, see
+                    _waitForPipelinedCommandReplies, otherwise the ok could belong to a queued command.
                     """
-                    waitingKeys = []
-                    for key in self.waiting.keys():
-                        if self.waiting[key] != None:
-                            waitingKeys.append(key)
+                    waiting = (
+                        bool(self._pendingCommands) | bool(self._pendingControls) << 1
+                    )
+                    toControl = self._REPLY_IS_CONTROL[waiting | (b"ok" in line) << 2]
 
-                    if len(waitingKeys) > 1:
+                    if toControl is None:
                         """
-                        Two are waiting for an answer, so two lines must be received to decide who gets which.
-                        ABORT and RESET always get the ok.
+                        A line that nobody waits for must not terminate the receive thread,
+                        otherwise no further reply could be received.
                         """
-                        line2 = self.serialConnection.readline()
-                        if DEBUG:
-                            self.writeLog(line2, "read")
-
-                        line2 = line2.decode("ASCII")
-
-                        if "ok" in line and "ok" in line2:
-                            for key in waitingKeys:
-                                self.queues[key].put("ok")
-                        elif "ok" in line:
-                            self.queues[CommandType.CONTROL.value].put(line)
-                            self.queues[CommandType.COMMAND.value].put(line2)
-                        elif "ok" in line2:
-                            self.queues[CommandType.CONTROL.value].put(line2)
-                            self.queues[CommandType.COMMAND.value].put(line)
-                        else:
-                            raise ValueError(
-                                "Unexpected error: line;line2 " + line + " ; " + line2
-                            )
-                        for key in self.waiting.keys():
-                            self.waiting[key] = None
-                    elif len(waitingKeys) == 1:
-                        self.queues[waitingKeys[0]].put(line)
-                        self.waiting[waitingKeys[0]] = None
-                    else:
-                        raise ValueError(
-                            "Nothing sent, which includes the answer: " + line
+                        print(
+                            "Nothing sent, which includes the answer: "
+                            + line.decode("ASCII", errors="replace").rstrip()
                         )
+                    elif toControl:
+                        self._pendingControls.popleft().put(line.decode("ASCII"))
+                    else:
+                        self._pendingCommands.popleft().put(line.decode("ASCII"))
+                        if len(self._pendingCommands) <= 1:
+                            with self._commandRepliesCondition:
+                                self._commandRepliesCondition.notify_all()
             except (SerialException, TypeError):
                 self._receiving_worker_is_running = False
 
         if self._receiving_worker_is_running is False:
-            waitingKeys = []
-            for key in self.waiting.keys():
-                if self.waiting[key] != None:
-                    waitingKeys.append(key)
-            for key in waitingKeys:
-                self.queues[key].put(None)
-                self.waiting[key] = None
+            while self._pendingCommands:
+                self._pendingCommands.popleft().put(None)
+            while self._pendingControls:
+                self._pendingControls.popleft().put(None)
+            with self._commandRepliesCondition:
+                self._commandRepliesCondition.notify_all()
         return
 
 
@@ -374,18 +675,38 @@ class SerialDataInterface(SerialInterface):
     def __init__(self, serialName: str):
         """Constructor"""
         self.queue = queue.SimpleQueue()
+        self._buffer = bytearray()
+        """
+        The counters are each written by only one thread, the receive thread and the reading thread.
+        """
+        self._numberOfReceivedBytes = 0
+        self._numberOfReadBytes = 0
         super().__init__(serialName)
         return
 
     def _telegramListenerJob(self) -> None:
-        """Method in which the receive thread runs."""
+        """Method in which the receive thread runs.
+
+        The received bytes are passed to the reading thread as whole chunks, which are then
+        collected in the buffer of the reading thread.
+        """
         while self._receiving_worker_is_running:
             try:
-                receivedBytes = self.serialConnection.read_all()
-
-                for byte in receivedBytes:
-                    self.queue.put(byte)
-            except:
+                """
+                The read of one byte blocks in the operating system until data has arrived,
+                then the bytes received meanwhile are read with one call.
+                If the blocking read is interrupted with cancel_read, nothing is returned.
+                """
+                receivedBytes = self._serialRead(1)
+                if not receivedBytes:
+                    continue
+                waitingBytes = self.serialConnection.in_waiting
+                if waitingBytes > 0:
+                    receivedBytes += self._serialRead(waitingBytes)
+
+                self._numberOfReceivedBytes += len(receivedBytes)
+                self.queue.put(receivedBytes)
+            except (SerialException, OSError, TypeError):
                 self._receiving_worker_is_running = False
 
         if self._receiving_worker_is_running is False:
@@ -400,7 +721,32 @@ class SerialDataInterface(SerialInterface):
 
         :returns: The available bytes.
         """
-        return self.queue.qsize()
+        return self._numberOfReceivedBytes - self._numberOfReadBytes
+
+    def _fillBuffer(self, timeout: Optional[float]) -> bool:
+        """Private method which appends the received chunks to the buffer.
+
+        It waits for the next chunk, then all chunks which are already in the queue are appended
+        without waiting, so that the reading thread is woken up only once for them.
+
+        :param timeout: The timeout for reading, None for blocking.
+        :returns: False if the receiving thread is terminated and nothing more will be received.
+        """
+        received = False
+        chunk = self.queue.get(block=True, timeout=timeout)
+        while chunk != None:
+            self._buffer += chunk
+            received = True
+            try:
+                chunk = self.queue.get_nowait()
+            except queue.Empty:
+                return True
+        """
+        A None is received when the receiving thread is terminated.
+        It is put back so that every further read also returns.
+        """
+        self.queue.put(None)
+        return received
 
     def readBytes(
         self, numberOfBytes: int, timeout: Optional[float] = None
@@ -412,14 +758,37 @@ class SerialDataInterface(SerialInterface):
         :returns: The bytesRead read.
         :rtype: bytearray
         """
-        bytesRead = bytearray()
-        for i in range(numberOfBytes):
-            byte = self.queue.get(block=True, timeout=timeout)
-            if byte != None:
-                """
-                A None is received when the receiving thread is terminated.
-                """
-                bytesRead.append(byte)
-            else:
+        buffer = self._buffer
+        while len(buffer) < numberOfBytes:
+            if not self._fillBuffer(timeout):
+                break
+        bytesRead = buffer[:numberOfBytes]
+        del buffer[:numberOfBytes]
+        self._numberOfReadBytes += len(bytesRead)
+        return bytesRead
+
+    def readUntil(
+        self, terminator: bytes = b"\0", timeout: Optional[float] = None
+    ) -> ByteString:
+        """Read from the interface until the terminator byte was read.
+
+        The serial port is read by the receive thread, so the terminator is searched in the buffer
+        of the received chunks. After a new chunk has been added, only the new bytes are searched.
+
+        :param terminator: The terminator, one byte.
+        :param timeout: The timeout for reading, None for blocking.
+        :returns: The bytes read, including the terminator.
+        :rtype: bytearray
+        """
+        buffer = self._buffer
+        end = buffer.find(terminator) + 1
+        while end == 0:
+            searchStart = len(buffer)
+            if not self._fillBuffer(timeout):
+                end = len(buffer)
                 break
+            end = buffer.find(terminator, searchStart) + 1
+        bytesRead = buffer[:end]
+        del buffer[:end]
+        self._numberOfReadBytes += len(bytesRead)
         return bytesRead